@@ -26,7 +26,8 @@ setup(
         "nbconvert>=6.5.0",
     ],
     extras_require={
-        "dev": ["pytest", "ipykernel", "notebook"],
+        "dev": ["pytest", "beautifulsoup4", "lxml", "ipykernel", "notebook"],
+        "fast": ["markdown-it-pyrs>=0.3.0", "mistune>=3.0.0", "orjson>=3.0.0"],
     },
     entry_points={
         "console_scripts": [
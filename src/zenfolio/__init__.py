@@ -2,6 +2,11 @@
 ZenFolio - A minimal, powerful academic website generator built with ZenCFG
 """
 
+import logging
+
+# Applications decide where the package's log messages go; the CLI sets up its own handler
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
 from .zenfolio import ZenFolio
 from .cli import cli
 
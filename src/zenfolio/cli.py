@@ -4,6 +4,7 @@ Command line interface for ZenFolio - academic website generator
 
 import argparse
 import http.server
+import logging
 import socketserver
 import threading
 import webbrowser
@@ -25,6 +26,18 @@ from .server import kill_existing_servers
 # Theme asset building is now handled directly by theme classes
 
 
+def _configure_logging(debug: bool):
+    """Show the package's debug messages on stdout, like the rest of the build output, only in debug mode"""
+    logger = logging.getLogger("zenfolio")
+    # cli() may run more than once in a process (tests, embedding): add the handler once
+    if not any(getattr(handler, '_zenfolio_cli', False) for handler in logger.handlers):
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler._zenfolio_cli = True
+        logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG if debug else logging.WARNING)
+
+
 def cli():
     """Command line interface"""
     parser = argparse.ArgumentParser(
@@ -80,9 +93,15 @@ def cli():
         action='store_true',
         help="Enable template debugging mode (shows undefined variable errors)"
     )
+    parser.add_argument(
+        '--clean-cache',
+        action='store_true',
+        help="Discard cached page content before building"
+    )
 
     
     args = parser.parse_args()
+    _configure_logging(args.debug)
     
     if args.command == 'init':
         init_site(args.content_dir)
@@ -108,7 +127,7 @@ def cli():
         # Theme assets are now built directly during site generation
         
         # Build the site using centralized error handling
-        success = build_site(args.content_dir, args.theme, args.debug, args.base_url, args.dev)
+        success = build_site(args.content_dir, args.theme, args.debug, args.base_url, args.dev, args.clean_cache)
         if not success:
             sys.exit(1)
     elif args.command == 'serve':
@@ -123,7 +142,7 @@ def cli():
         # Theme assets are now built directly during site generation
         
         # Build the site using centralized error handling (force dev=True)
-        success = build_site(args.content_dir, args.theme, args.debug, args.base_url, dev=True)
+        success = build_site(args.content_dir, args.theme, args.debug, args.base_url, dev=True, clean_cache=args.clean_cache)
         if not success:
             print("❌ Build failed. Cannot start development server.")
             sys.exit(1)
@@ -136,7 +155,7 @@ def cli():
         
         # Theme assets are now built directly during site generation
         
-        success = build_site(args.content_dir, args.theme, args.debug, args.base_url, dev=False)
+        success = build_site(args.content_dir, args.theme, args.debug, args.base_url, dev=False, clean_cache=args.clean_cache)
         if not success:
             print("❌ Build failed. Cannot prepare deployment.")
             sys.exit(1)
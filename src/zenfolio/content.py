@@ -2,6 +2,7 @@
 This module defines the content model for the ZenFolio website generator.
 It handles loading, parsing, and organizing all content from the user's content directory.
 """
+import logging
 import markdown
 from pathlib import Path
 from typing import Dict, List, Any, Optional
@@ -9,20 +10,41 @@ from typing import Dict, List, Any, Optional
 from .parsers import BibtexParser, parser_registry
 from .models.content_models import BlogPost, Page, Bio
 
+log = logging.getLogger(__name__)
+
+
+class PageTable:
+    """
+    Standalone pages as parallel columns of the fields read for every page.
+    
+    rows keeps the full page dicts, in the same order, for everything else.
+    """
+    __slots__ = ('rows', 'slugs', 'titles', 'contents', 'content_types')
+    
+    def __init__(self, pages: List[Dict[str, Any]]):
+        self.rows = pages
+        self.slugs = [page['slug'] for page in pages]
+        self.titles = [page['title'] for page in pages]
+        self.contents = [page['content'] for page in pages]
+        self.content_types = [page.get('content_type', 'page') for page in pages]
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+
 
 class Content:
     """A class to represent the website's content."""
 
-    def __init__(self, content_dir: Path, config: Any, debug: bool = False):
+    def __init__(self, content_dir: Path, config: Any):
         self.content_dir = content_dir
         self.config = config
-        self.debug = debug
         self.parser_registry = parser_registry
 
         self.bio: Dict[str, Any] = {}
         self.publications: List[Dict[str, Any]] = []
         self.blog_posts: List[Dict[str, Any]] = []
         self.pages: List[Dict[str, Any]] = []
+        self.page_table = PageTable(self.pages)
 
     def load(self):
         """Load all content from the content directory."""
@@ -31,6 +53,7 @@ class Content:
         self.publications = self._safe_parse_publications()
         self.blog_posts = self._safe_parse_blog_posts()
         self.pages = self._safe_parse_pages()
+        self.page_table = PageTable(self.pages)
 
     def _safe_parse_bio_data(self):
         """Safely parse bio data with error handling"""
@@ -61,17 +84,14 @@ class Content:
                     'affiliation': self.config.author.affiliation if hasattr(self.config.author, 'affiliation') else '',
                 }
             
-            if self.debug:
-                print("⚠️  Warning: No suitable parser found for index.md, using empty bio data")
+            log.debug("⚠️  Warning: No suitable parser found for index.md, using empty bio data")
             return Bio().to_dict()
             
         except FileNotFoundError:
-            if self.debug:
-                print("⚠️  Warning: index.md not found, using empty bio data")
+            log.debug("⚠️  Warning: index.md not found, using empty bio data")
             return Bio().to_dict()
         except Exception as e:
-            if self.debug:
-                print(f"⚠️  Warning: Failed to parse index.md: {e}")
+            log.debug("⚠️  Warning: Failed to parse index.md: %s", e)
             return Bio().to_dict()
 
     def _safe_parse_publications(self):
@@ -83,15 +103,13 @@ class Content:
                 bibtex_file_path = self.content_dir / self.config.publications.bib_path
             
             if not bibtex_file_path or not bibtex_file_path.exists():
-                if self.debug:
-                    print(f"⚠️  Warning: BibTeX file not found, using empty publications")
+                log.debug("⚠️  Warning: BibTeX file not found, using empty publications")
                 return []
             
             bibtex_parser = BibtexParser(self.config.publications.highlight_author)
             return bibtex_parser.parse_file(bibtex_file_path)
         except Exception as e:
-            if self.debug:
-                print(f"⚠️  Warning: Failed to parse publications: {e}")
+            log.debug("⚠️  Warning: Failed to parse publications: %s", e)
             return []
 
     def _safe_parse_blog_posts(self):
@@ -99,14 +117,12 @@ class Content:
         try:
             # Check if blog is disabled in configuration
             if not self.config.site.blog_folder:
-                if self.debug:
-                    print("⚠️  Blog disabled in configuration (site.blog_folder = None)")
+                log.debug("⚠️  Blog disabled in configuration (site.blog_folder = None)")
                 return []
             
             blog_dir = self.content_dir / self.config.site.blog_folder
             if not blog_dir.exists():
-                if self.debug:
-                    print(f"⚠️  Warning: blog directory '{self.config.site.blog_folder}' not found, using empty blog posts")
+                log.debug("⚠️  Warning: blog directory '%s' not found, using empty blog posts", self.config.site.blog_folder)
                 return []
             
             all_raw_posts = []
@@ -124,8 +140,7 @@ class Content:
                         else:
                             all_raw_posts.append(raw_post)
                 except Exception as e:
-                    if self.debug:
-                        print(f"⚠️  Warning: Parser {parser.__class__.__name__} failed: {e}")
+                    log.debug("⚠️  Warning: Parser %s failed: %s", parser.__class__.__name__, e)
                     continue
             
             seen_slugs = set()
@@ -142,8 +157,7 @@ class Content:
                     blog_post = BlogPost(**raw_post, content_raw=raw_post.get('content', ''))
                     validated_posts.append(blog_post.to_dict())
                 except Exception as e:
-                    if self.debug:
-                        print(f"⚠️  Warning: Failed to validate blog post {raw_post.get('slug', 'unknown')}: {e}")
+                    log.debug("⚠️  Warning: Failed to validate blog post %s: %s", raw_post.get('slug', 'unknown'), e)
                     continue
             
             return validated_posts
@@ -164,8 +178,7 @@ class Content:
             
             parser = self.parser_registry.get_parser_for_file(file_path)
             if not parser:
-                if self.debug:
-                    print(f"⚠️  Warning: No parser found for {file_path}")
+                log.debug("⚠️  Warning: No parser found for %s", file_path)
                 continue
             
             raw_data = parser.parse_file(file_path)
@@ -184,7 +197,6 @@ class Content:
                 page = Page(**raw_page_data)
                 parsed_pages.append(page.to_dict())
             except Exception as e:
-                if self.debug:
-                    print(f"⚠️  Warning: Failed to validate page {file_path}: {e}")
+                log.debug("⚠️  Warning: Failed to validate page %s: %s", file_path, e)
                 continue
         return parsed_pages
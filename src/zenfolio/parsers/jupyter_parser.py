@@ -6,10 +6,21 @@ Implements ContentParser protocol for parsing .ipynb files.
 from pathlib import Path
 from typing import Dict, List, Any, Set
 import json
+import re
 import nbformat
 import frontmatter
 from nbconvert import HTMLExporter
 from .base_parser import ContentParser
+from .markdown_parser import create_markdown_renderer
+
+
+# Pilcrow anchor links (¶ symbols), empty anchor links, and any remaining anchor links
+_PILCROW_ANCHOR_RE = re.compile(r'<a\s+class="anchor-link"\s+href="[^"]*">¶</a>')
+_EMPTY_ANCHOR_RE = re.compile(r'<a\s+class="anchor-link"[^>]*></a>')
+_ANCHOR_RE = re.compile(r'<a[^>]*class="anchor-link"[^>]*>.*?</a>', re.DOTALL)
+
+# Extensions used by the notebook template's markdown filter
+_NOTEBOOK_MARKDOWN_EXTENSIONS = ('fenced_code', 'codehilite', 'tables', 'admonition', 'def_list', 'attr_list', 'footnotes')
 
 
 class JupyterParser(ContentParser):
@@ -86,8 +97,7 @@ class JupyterParser(ContentParser):
             # Add missing filters to the nbconvert environment
             def markdown_filter(text: str) -> str:
                 """Render markdown text to HTML."""
-                import markdown
-                return markdown.markdown(text, extensions=['fenced_code', 'codehilite', 'tables', 'admonition', 'def_list', 'attr_list', 'footnotes'])
+                return create_markdown_renderer(_NOTEBOOK_MARKDOWN_EXTENSIONS)(text)
             
             def strip_files_prefix_filter(text: str) -> str:
                 """Remove files/ prefix from paths."""
@@ -117,16 +127,14 @@ class JupyterParser(ContentParser):
         """
         Clean up notebook HTML content by removing unwanted elements.
         """
-        import re
-        
         # Remove pilcrow anchor links (¶ symbols)
-        html_content = re.sub(r'<a\s+class="anchor-link"\s+href="[^"]*">¶</a>', '', html_content)
+        html_content = _PILCROW_ANCHOR_RE.sub('', html_content)
         
         # Remove empty anchor links
-        html_content = re.sub(r'<a\s+class="anchor-link"[^>]*></a>', '', html_content)
+        html_content = _EMPTY_ANCHOR_RE.sub('', html_content)
         
         # Clean up any remaining anchor-link references
-        html_content = re.sub(r'<a[^>]*class="anchor-link"[^>]*>.*?</a>', '', html_content, flags=re.DOTALL)
+        html_content = _ANCHOR_RE.sub('', html_content)
         
         return html_content
     
@@ -3,12 +3,141 @@ Markdown parser for content files, powered by the python-frontmatter library.
 v3.0 - Implements ContentParser protocol for extensible parsing system.
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Set
+from typing import Callable, Dict, List, Any, Set
 import frontmatter
+import markdown
+import os
+import re
 import textwrap
+import threading
 from .base_parser import ContentParser
 
+
+# Opt-in mistune backend (pip install zenfolio[fast]) for extension sets it fully covers.
+# Its HTML is not identical to Python-Markdown's: footnotes use different markup
+# (<section class="footnotes">, fn-1 ids), tables are indented, and adjacent lists stay
+# separate where Python-Markdown merges them; hence the switch
+_MISTUNE = os.environ.get('ZF_MISTUNE', '').lower() in ('1', 'true', 'yes')
+
+# Python-Markdown extensions with an equivalent mistune plugin (None: built into mistune)
+_MISTUNE_PLUGINS = {
+    'fenced_code': None,
+    'tables': 'table',
+    'footnotes': 'footnotes',
+    'def_list': 'def_list',
+    'abbr': 'abbr',
+}
+
+
+# A single line of text that Python-Markdown renders as-is inside <p>: starts with a letter
+# (no list/heading markers), no surrounding whitespace, tabs, or inline/HTML syntax
+_PLAIN_TEXT_RE = re.compile(r'[A-Za-z](?:[^\t\n\r\x02\x03\\`*_{}\[\]<>&]*[^\s\x02\x03\\`*_{}\[\]<>&])?\Z')
+
+# Python-Markdown extensions that leave such a line untouched
+_PLAIN_TEXT_SAFE_EXTENSIONS = frozenset({
+    'fenced_code', 'codehilite', 'tables', 'admonition', 'def_list', 'attr_list',
+    'footnotes', 'abbr', 'extra',
+})
+
+
+# Opt-in Rust backend (pip install zenfolio[fast]); its CommonMark output differs from
+# Python-Markdown's (no codehilite, admonitions or attribute lists), hence the switch
+_FAST_MD = os.environ.get('ZF_FAST_MD', '').lower() in ('1', 'true', 'yes')
+
+# Backend the switches select, part of the page cache keys (falling back to Python-Markdown
+# when the library is missing, or for extensions mistune does not cover, costs a rebuild at most)
+MARKDOWN_BACKEND = 'markdown-it-pyrs' if _FAST_MD else 'mistune' if _MISTUNE else 'markdown'
+
+# Python-Markdown extensions with an equivalent markdown-it-pyrs plugin
+_FAST_MD_PLUGINS = {
+    'tables': 'table',
+    'footnotes': 'footnote',
+    'def_list': 'deflist',
+}
+
+
+def _extension_name(extension) -> str:
+    """'markdown.extensions.tables' -> 'tables'; extension instances have no name"""
+    return extension.rpartition('.')[2] if isinstance(extension, str) else None
+
+
+def _mistune_plugins(extensions) -> List[str]:
+    """mistune plugins for the given extensions, or None if any of them has no equivalent"""
+    plugins = []
+    for extension in extensions:
+        name = _extension_name(extension)
+        if name not in _MISTUNE_PLUGINS:
+            return None
+        if _MISTUNE_PLUGINS[name]:
+            plugins.append(_MISTUNE_PLUGINS[name])
+    return plugins
+
+
+def _mistune_renderer(extensions) -> Callable[[str], str]:
+    """mistune renderer for the extensions, or None if one has no equivalent or mistune is not installed"""
+    plugins = _mistune_plugins(extensions)
+    if plugins is None:
+        return None
+    try:
+        import mistune
+    except ImportError:
+        print("⚠️  ZF_MISTUNE is set but mistune is not installed, using Python-Markdown")
+        return None
+    return mistune.create_markdown(escape=False, plugins=plugins)
+
+
+def _fast_markdown_renderer(extensions) -> Callable[[str], str]:
+    """markdown-it-pyrs renderer with the plugins matching the extensions, or None if not installed"""
+    try:
+        from markdown_it_pyrs import MarkdownIt
+    except ImportError:
+        print("⚠️  ZF_FAST_MD is set but markdown-it-pyrs is not installed, using Python-Markdown")
+        return None
+    md = MarkdownIt('commonmark')
+    for extension in extensions:
+        plugin = _FAST_MD_PLUGINS.get(_extension_name(extension))
+        if plugin:
+            md.enable(plugin)
+    return md.render
+
+
+@lru_cache(maxsize=None)
+def create_markdown_renderer(extensions: tuple = ()) -> Callable[[str], str]:
+    """
+    Build a markdown -> HTML function for a set of Python-Markdown extensions, once per set.
+    
+    Uses a single reused Python-Markdown instance, which avoids re-loading the extensions
+    on every call like markdown.markdown does. Python-Markdown instances are stateful, so
+    each thread gets its own. Plain one-line text (most excerpts and short descriptions)
+    skips the parser entirely.
+    
+    Setting ZF_FAST_MD=1 switches every extension set to markdown-it-pyrs, and ZF_MISTUNE=1
+    the sets mistune fully covers to mistune, when installed; both change the HTML.
+    """
+    if _FAST_MD:
+        renderer = _fast_markdown_renderer(extensions)
+        if renderer is not None:
+            return renderer
+    
+    if _MISTUNE:
+        renderer = _mistune_renderer(extensions)
+        if renderer is not None:
+            return renderer
+    
+    local = threading.local()
+    plain_text_ok = all(_extension_name(extension) in _PLAIN_TEXT_SAFE_EXTENSIONS for extension in extensions)
+    
+    def render(text: str) -> str:
+        if plain_text_ok and _PLAIN_TEXT_RE.match(text):
+            return '<p>' + text + '</p>'
+        md = getattr(local, 'md', None)
+        if md is None:
+            md = local.md = markdown.Markdown(extensions=list(extensions))
+        return md.reset().convert(text)
+    return render
+
 class MarkdownParser(ContentParser):
     """
     Parser for markdown content files with YAML frontmatter.
@@ -33,9 +162,8 @@ class MarkdownParser(ContentParser):
         """Return markdown processing function for content types."""
         def process_markdown(content: str, markdown_extensions: List[str]) -> str:
             """Process markdown content with normalization."""
-            import markdown
             normalized_content = textwrap.dedent(content).strip()
-            return markdown.markdown(normalized_content, extensions=markdown_extensions)
+            return create_markdown_renderer(tuple(markdown_extensions))(normalized_content)
         return process_markdown
     
     def parse_file(self, file_path: Path) -> Dict[str, Any]:
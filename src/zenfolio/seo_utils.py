@@ -3,11 +3,20 @@ SEO utilities for ZenFolio - Generate structured data and metadata
 Implements Person, ScholarlyArticle, and BlogPosting schemas for enhanced search appearance
 """
 
+import io
 import json
+import re
 from typing import Dict, List, Any, Optional
+from xml.sax.saxutils import XMLGenerator
 from .utils import build_url
 
 
+_HTML_TAG_RE = re.compile('<[^<]+?>')
+
+# Namespace of the sitemap protocol's <urlset>
+_SITEMAP_NS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+
+
 class SEOGenerator:
     """Generates SEO metadata and structured data for academic websites"""
     
@@ -249,8 +258,7 @@ class SEOGenerator:
         elif page_type == "blog_post" and item:
             if item.get('excerpt'):
                 # Clean HTML tags from excerpt for meta description
-                import re
-                clean_excerpt = re.sub('<[^<]+?>', '', item['excerpt'])
+                clean_excerpt = _HTML_TAG_RE.sub('', item['excerpt'])
                 return clean_excerpt[:155] + ('...' if len(clean_excerpt) > 155 else '')
             return f"A blog post by {author_name} about {item.get('title', 'research and development')}."
             
@@ -271,31 +279,41 @@ class SEOGenerator:
     
     def generate_sitemap_xml(self, pages: List[Dict[str, str]]) -> str:
         """Generate sitemap.xml content"""
-        sitemap_entries = []
+        out = io.StringIO()
+        self._write_sitemap(pages, out)
+        return out.getvalue()
+    
+    def write_sitemap_xml(self, pages: List[Dict[str, str]], path) -> None:
+        """Stream sitemap.xml straight to a file, without building the document in memory"""
+        with open(path, 'wb', buffering=1 << 17) as f:
+            self._write_sitemap(pages, f)
+    
+    def _write_sitemap(self, pages: List[Dict[str, str]], out) -> None:
+        """Write the sitemap document to a text or binary stream"""
+        gen = XMLGenerator(out, 'UTF-8')
+        gen.startDocument()
+        gen.startElement('urlset', {'xmlns': _SITEMAP_NS})
         
         for page in pages:
-            url = self._build_url(page['path'])
-            priority = page.get('priority', '0.5')
-            changefreq = page.get('changefreq', 'monthly')
+            fields = [
+                ('loc', self._build_url(page['path'])),
+                ('changefreq', page.get('changefreq', 'monthly')),
+                ('priority', page.get('priority', '0.5')),
+            ]
             lastmod = page.get('lastmod', '')
-            
-            entry = f"""  <url>
-    <loc>{url}</loc>
-    <changefreq>{changefreq}</changefreq>
-    <priority>{priority}</priority>"""
-            
             if lastmod:
-                entry += f"""
-    <lastmod>{lastmod}</lastmod>"""
-                
-            entry += """
-  </url>"""
+                fields.append(('lastmod', lastmod))
             
-            sitemap_entries.append(entry)
-        
-        sitemap_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-{chr(10).join(sitemap_entries)}
-</urlset>"""
+            gen.ignorableWhitespace('\n  ')
+            gen.startElement('url', {})
+            for name, value in fields:
+                gen.ignorableWhitespace('\n    ')
+                gen.startElement(name, {})
+                gen.characters(str(value))
+                gen.endElement(name)
+            gen.ignorableWhitespace('\n  ')
+            gen.endElement('url')
         
-        return sitemap_xml
\ No newline at end of file
+        gen.ignorableWhitespace('\n')
+        gen.endElement('urlset')
+        gen.endDocument()
\ No newline at end of file
@@ -3,39 +3,142 @@ Base Theme Class for ZenFolio
 Provides common Jinja2 setup and rendering functionality
 """
 
+import hashlib
 from datetime import datetime
-from jinja2 import Environment, StrictUndefined, DebugUndefined, FileSystemLoader
+from functools import lru_cache
+from jinja2 import Environment, pass_context, StrictUndefined, DebugUndefined, FileSystemLoader, BytecodeCache, FileSystemBytecodeCache
 from pathlib import Path
 from abc import ABC, abstractmethod
-from ..utils import build_url
+from ..parsers.markdown_parser import create_markdown_renderer
+from ..utils import build_url, write_bytes
+
+
+# Stand-in content for render_content_wrapper; the angle brackets make it disappear
+# if a template escapes or otherwise transforms the content
+_CONTENT_PROBE = '<zenfolio-content-probe>'
+
+
+@lru_cache(maxsize=64)
+def _build_relative_url(base_url: str, depth: int) -> str:
+    """Base URL for pages nested depth levels deep; see BaseTheme._build_relative_url"""
+    # Handle absolute URLs - they don't need adjustment
+    if base_url.startswith(('http://', 'https://')):
+        return base_url
+    
+    # For relative URLs, go up the appropriate number of levels
+    if not base_url or base_url in ['', './']:
+        return '../' * depth
+    
+    # Handle custom relative paths
+    return str(Path('../' * depth) / base_url).replace('\\', '/')
+
+
+class _MemoryBytecodeCache(BytecodeCache):
+    """
+    Keeps compiled template bytecode in memory for the lifetime of the process,
+    optionally backed by a persistent cache that survives between builds.
+    """
+    
+    def __init__(self, persistent: BytecodeCache = None):
+        self._bytecode = {}
+        self._persistent = persistent
+    
+    def load_bytecode(self, bucket):
+        # Jinja checks the stored source checksum itself and ignores stale entries
+        bytecode = self._bytecode.get(bucket.key)
+        if bytecode is not None:
+            bucket.bytecode_from_string(bytecode)
+        elif self._persistent is not None:
+            self._persistent.load_bytecode(bucket)
+            if bucket.code is not None:
+                self._bytecode[bucket.key] = bucket.bytecode_to_string()
+    
+    def dump_bytecode(self, bucket):
+        self._bytecode[bucket.key] = bucket.bytecode_to_string()
+        if self._persistent is not None:
+            try:
+                self._persistent.dump_bytecode(bucket)
+            except OSError:
+                # A read-only or full cache directory only costs the next run a recompile
+                pass
+    
+    def clear(self):
+        self._bytecode.clear()
+        if self._persistent is not None:
+            self._persistent.clear()
+
+
+_memory_bytecode_cache = _MemoryBytecodeCache()
+_persistent_bytecode_cache = None
+
+
+def _get_bytecode_cache(debug: bool) -> BytecodeCache:
+    """
+    Bytecode cache shared by every theme instance, so file templates are only compiled
+    once per process and, outside debug mode, reused across builds from ~/.cache/zenfolio/jinja.
+    Templates themselves stay per instance since they are bound to the environment's globals.
+    """
+    global _persistent_bytecode_cache
+    if debug:
+        # Edited templates are picked up anyway (checksums), but keep debug builds self-contained
+        return _memory_bytecode_cache
+    if _persistent_bytecode_cache is None:
+        try:
+            cache_dir = Path.home() / ".cache" / "zenfolio" / "jinja"
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            persistent = FileSystemBytecodeCache(str(cache_dir), "%s.cache")
+        except (OSError, RuntimeError):
+            # No writable home directory, fall back to the in-process cache only
+            persistent = None
+        _persistent_bytecode_cache = _MemoryBytecodeCache(persistent)
+    return _persistent_bytecode_cache
 
 
 class BaseTheme(ABC):
     """Base class for all ZenFolio themes with common Jinja2 functionality"""
     
-    def __init__(self, template_dir: Path = None, debug=False):
+    # Components whose output is empty unless the named argument is set, so rendering
+    # them can be skipped outright
+    CONDITIONAL_COMPONENTS = {'mathjax': 'mathjax_config'}
+    
+    # Files the theme writes into the output's static/ folder, which the static sync keeps
+    STATIC_ASSETS = ()
+    
+    # Extensions used by the markdown template filter
+    MARKDOWN_FILTER_EXTENSIONS = ('fenced_code', 'codehilite', 'tables', 'admonition', 'def_list', 'attr_list', 'footnotes')
+    
+    def __init__(self, template_dir: Path = None, debug=False, loader=None):
         # Configure Jinja2 environment with debugging options
         undefined_handler = StrictUndefined if debug else DebugUndefined
         
-        loader = FileSystemLoader(template_dir) if template_dir else None
+        if loader is None and template_dir:
+            loader = FileSystemLoader(template_dir)
         
+        # Autoescaping stays off: every template variable comes from the site's own
+        # config and content files, and most of them are pre-rendered HTML.
+        # Templates don't change during a build, so skip the per-lookup mtime checks
         self.env = Environment(
             loader=loader,
+            autoescape=False,
             trim_blocks=True, 
             lstrip_blocks=True,
-            undefined=undefined_handler
+            undefined=undefined_handler,
+            auto_reload=False,
+            cache_size=-1,
+            bytecode_cache=_get_bytecode_cache(debug)
         )
         self.env.globals['theme'] = self
         
-        # Add a global url_for function for page links
-        def url_for(path: str) -> str:
-            base_url = self.env.globals.get('base_url', '')
-            return build_url(base_url, path)
+        # Add a global url_for function for page links. It reads base_url from the
+        # render context, so each render passes its own instead of sharing a global
+        @pass_context
+        def url_for(context, path: str) -> str:
+            return build_url(context.get('base_url') or '', path)
 
         # Add a global file function for static files
-        def file(path: str) -> str:
-            base_url = self.env.globals.get('base_url', '')
-            return build_url(base_url, f'static/{path.lstrip("/")}')
+        @pass_context
+        def file(context, path: str) -> str:
+            return build_url(context.get('base_url') or '', f'static/{path.lstrip("/")}')
 
         self.env.globals['url_for'] = url_for
         self.env.globals['file'] = file
@@ -48,6 +151,11 @@ class BaseTheme(ABC):
         self.debug = debug
         self.env.globals['theme'] = self
         
+        # Bound render methods of registered components, filled by _register_component
+        self._render_funcs = {}
+        # (prefix, suffix) around the content of wrapper components, () if not splittable
+        self._content_wrappers = {}
+        self._template_digest = None
         self._register_templates()
 
     def _highlight_code_filter(self, code: str, **kwargs) -> str:
@@ -56,8 +164,7 @@ class BaseTheme(ABC):
 
     def _markdown_filter(self, text: str) -> str:
         """Render markdown text to HTML."""
-        import markdown
-        return markdown.markdown(text, extensions=['fenced_code', 'codehilite', 'tables', 'admonition', 'def_list', 'attr_list', 'footnotes'])
+        return create_markdown_renderer(self.MARKDOWN_FILTER_EXTENSIONS)(text)
 
     def _strip_files_prefix_filter(self, text: str) -> str:
         """A simple placeholder filter."""
@@ -77,28 +184,53 @@ class BaseTheme(ABC):
         Returns:
             Adjusted base URL for the nested page
         """
-        # Handle absolute URLs - they don't need adjustment
-        if base_url.startswith(('http://', 'https://')):
-            return base_url
-        
-        # For relative URLs, go up the appropriate number of levels
-        if not base_url or base_url in ['', './']:
-            return '../' * depth
+        return _build_relative_url(base_url, depth)
+    
+    def template_digest(self) -> str:
+        """
+        Hash of every template source the theme renders with, computed once
         
-        # Handle custom relative paths
-        return str(Path('../' * depth) / base_url).replace('\\', '/')
+        Build caches key on it so that edited templates (e.g. in an editable install,
+        without a version change) are not served from stale entries.
+        """
+        if self._template_digest is None:
+            digest = hashlib.sha256()
+            loader = self.env.loader
+            if loader is not None:
+                for name in sorted(loader.list_templates()):
+                    digest.update(name.encode('utf-8'))
+                    digest.update(b'\0')
+                    digest.update(loader.get_source(self.env, name)[0].encode('utf-8'))
+                    digest.update(b'\0')
+            for source in self._inline_template_sources():
+                digest.update(source.encode('utf-8'))
+                digest.update(b'\0')
+            self._template_digest = digest.hexdigest()
+        return self._template_digest
+    
+    def _inline_template_sources(self):
+        """Template sources defined in code rather than loaded from files"""
+        return ()
     
     @abstractmethod
     def _register_templates(self):
         """Register theme-specific templates - must be implemented by subclasses"""
         pass
     
+    def _register_component(self, component_name: str, template):
+        """Expose a component template to other templates and to render_component"""
+        self.env.globals[component_name] = template
+        self._render_funcs[component_name] = template.render
+    
     def render_component(self, component_name: str, **kwargs) -> str:
         """Render a component template with given context, with robust error handling"""
-        template = self.env.globals.get(component_name)
-        if template:
+        required_arg = self.CONDITIONAL_COMPONENTS.get(component_name)
+        if required_arg is not None and not kwargs.get(required_arg):
+            return ""
+        render = self._render_funcs.get(component_name)
+        if render is not None:
             try:
-                return template.render(**kwargs)
+                return render(**kwargs)
             except Exception as e:
                 error_msg = f"❌ Template rendering failed for '{component_name}': {str(e)}"
                 if self.debug:
@@ -111,7 +243,7 @@ class BaseTheme(ABC):
             error_msg = f"❌ Missing template: '{component_name}'"
             if self.debug:
                 print(error_msg)
-                available_templates = [k for k in self.env.globals.keys() if not k.startswith('_')]
+                available_templates = list(self._render_funcs)
                 print(f"💡 Available templates: {available_templates}")
             return f"<!-- {error_msg} -->"
     
@@ -127,9 +259,6 @@ class BaseTheme(ABC):
     def render_page(self, content: str, page_title: str = "", author_name: str = "",
                     site_description: str = "", base_url: str = "", include_navbar: bool = True, **context) -> str:
         """Render a complete page using the base layout template"""
-        # Make base_url available to the url_for global function
-        self.env.globals['base_url'] = base_url
-        
         template = self.env.from_string(self.BASE_LAYOUT_TEMPLATE)
         
         # Render modular components
@@ -138,6 +267,7 @@ class BaseTheme(ABC):
         if include_navbar:
             navbar_html = self.render_component('navbar', 
                 author_name=author_name, 
+                base_url=base_url,
                 **context)
             footer_html = self.render_component('footer', 
                 author_name=author_name, 
@@ -156,6 +286,26 @@ class BaseTheme(ABC):
             **context
         )
     
+    def render_content_wrapper(self, component_name: str, content: str) -> str:
+        """
+        Render a component whose item is only {'content': content}, such as 'page'
+        
+        The template is rendered once around a probe and split there, so later calls are
+        a concatenation; templates that do anything but insert the content verbatim, once,
+        keep being rendered normally.
+        """
+        parts = self._content_wrappers.get(component_name)
+        if parts is None:
+            pieces = self.render_component(component_name, item={'content': _CONTENT_PROBE}).split(_CONTENT_PROBE)
+            parts = self._content_wrappers[component_name] = tuple(pieces) if len(pieces) == 2 else ()
+        if not parts or not content:
+            return self.render_component(component_name, item={'content': content})
+        return parts[0] + content + parts[1]
+    
+    def render_page_to_file(self, path: Path, **page) -> None:
+        """Render a complete page straight to a file; themes that can stream their output override this"""
+        write_bytes(path, self.render_page(**page).encode('utf-8'))
+    
     def render_standalone_page(self, content: str, page_title: str = "", author_name: str = "",
                               site_description: str = "", base_url: str = "", **context) -> str:
         """Render a standalone page without navbar/footer"""
@@ -3,94 +3,129 @@ Zen Minimal Theme for ZenFolio - World-Class Academic Design
 v3.0 - Refined Typography, Enhanced Visual Impact, Professional Polish
 """
 
+import re
+from datetime import datetime
 from pathlib import Path
+from markupsafe import escape
 from ..base_theme import BaseTheme
-from ...utils import get_theme_directory
+from ...utils import get_theme_directory, copy_file_if_changed, write_chunks
+
+
+class _FormatTemplate:
+    """Stand-in for a Jinja template whose source is a plain str.format string"""
+
+    def __init__(self, source: str):
+        self.source = source
+
+    def render(self, **context) -> str:
+        return self.source.format(**context)
+
+
+_TEMPLATE_DIR = get_theme_directory(__file__) / "templates"
+
+# File templates shipped with the theme, listed once at import rather than globbed per instance
+_FILE_TEMPLATE_NAMES = tuple(sorted(path.name for path in _TEMPLATE_DIR.glob("*.html.j2")))
+
+# Placeholders substituted into the pre-rendered base layout on every page
+_LAYOUT_SLOTS = ('content', 'page_title', 'meta_description', 'navbar', 'footer', 'seo_head', 'mathjax_html')
+_LAYOUT_SLOT_RE = re.compile(r"\x00(\w+)\x00")
+
 
 class MinimalTheme(BaseTheme):
     """World-class zen minimal academic theme with sophisticated aesthetics"""
     
+    STATIC_ASSETS = ('style.css', 'theme.js')
+    
 
     
     def _register_templates(self):
         """Register component templates - file-based with inline fallbacks"""
         # First, load any file-based templates (these take priority)
         file_templates = set()
-        if self.template_dir.exists():
-            for template_path in self.template_dir.glob("*.html.j2"):
-                component_name = template_path.stem.replace(".html", "")
-                try:
-                    self.env.globals[component_name] = self.env.get_template(template_path.name)
-                    file_templates.add(component_name)
-                    if self.debug:
-                        print(f"✅ Loaded file template: {component_name}")
-                except Exception as e:
-                    if self.debug:
-                        print(f"⚠️ Failed to load template '{component_name}': {e}")
+        for template_name in _FILE_TEMPLATE_NAMES:
+            component_name = template_name[:-len(".html.j2")]
+            try:
+                self._register_component(component_name, self.env.get_template(template_name))
+                file_templates.add(component_name)
+                if self.debug:
+                    print(f"✅ Loaded file template: {component_name}")
+            except Exception as e:
+                if self.debug:
+                    print(f"⚠️ Failed to load template '{component_name}': {e}")
         
         # Then register inline templates for components not covered by files
-        inline_templates = {
-            # Core layout components
-            'navbar': self.NAVBAR_TEMPLATE,
-            'footer': self.FOOTER_TEMPLATE,
-            'page_layout': self.PAGE_LAYOUT_TEMPLATE,
-            'landing_page': self.LANDING_PAGE_TEMPLATE,
-            'profile_hero': self.PROFILE_HERO_TEMPLATE,
-            'bio_section': self.BIO_SECTION_TEMPLATE,
-            'section': self.SECTION_TEMPLATE,
-            'divider': self.DIVIDER_TEMPLATE,
-            
-            # Item templates
-            'publication_item': self.PUBLICATION_ITEM_TEMPLATE,
-            'project_item': self.PROJECT_ITEM_TEMPLATE,
-            'news_item': self.NEWS_ITEM_TEMPLATE,
-            'talk_item': self.TALK_ITEM_TEMPLATE,
-            'blog_post_item': self.BLOG_POST_ITEM_TEMPLATE,
-            'service_item': self.SERVICE_ITEM_TEMPLATE,
-            
-            # Page templates
-            'blog_post_page': self.BLOG_POST_PAGE_TEMPLATE,
-            'page': self.PAGE_TEMPLATE,
-            
-            # Enhanced service templates
-            'service_section': self.SERVICE_SECTION_TEMPLATE,
-            'service_section_header': self.SERVICE_SECTION_HEADER_TEMPLATE,
-            'service_group': self.SERVICE_GROUP_TEMPLATE,
-        }
-        
-        # Only register inline templates that don't have file equivalents
-        for name, template in inline_templates.items():
+        for name, attr in self._INLINE_TEMPLATES:
             if name not in file_templates:
-                self.env.globals[name] = self.env.from_string(template)
+                template = getattr(self, attr)
+                if name in self.FORMAT_TEMPLATES:
+                    self._register_component(name, _FormatTemplate(template))
+                else:
+                    self._register_component(name, self.env.from_string(template))
     
 
     
+    def _inline_template_sources(self):
+        """The base layout and the inline component templates"""
+        return [self.BASE_LAYOUT_TEMPLATE] + [getattr(self, attr) for _, attr in self._INLINE_TEMPLATES]
+    
     def __init__(self, debug=False):
-        self.template_dir = get_theme_directory(__file__) / "templates"
+        self.template_dir = _TEMPLATE_DIR
         super().__init__(template_dir=self.template_dir, debug=debug)
+        self._layout_template = self.env.from_string(self.BASE_LAYOUT_TEMPLATE)
+        self._layout_skeletons = {}
     
-    def render_page(self, content: str, page_title: str = "", author_name: str = "",
-                    site_description: str = "", base_url: str = "", **context) -> str:
-        """Override base render_page to handle SEO and built_pages context"""
-        # Make base_url available to the url_for and file global functions
-        self.env.globals['base_url'] = base_url
+    def _layout_skeleton(self, base_url: str, author_name: str, site_description: str, present: tuple):
+        """
+        Render the base layout once with sentinels in place of the per-page slots.
         
-        template = self.env.from_string(self.BASE_LAYOUT_TEMPLATE)
+        Returns the literal chunks with the slot names at the odd indices, ready to be
+        filled in and joined. Which optional slots are non-empty changes the layout's
+        conditionals, so that is part of the cache key along with the site-wide fields.
+        """
+        key = (base_url, author_name, site_description, present)
+        skeleton = self._layout_skeletons.get(key)
+        if skeleton is None:
+            sentinels = {name: f"\x00{name}\x00" if filled else ""
+                         for name, filled in zip(_LAYOUT_SLOTS, present)}
+            html = self._layout_template.render(
+                author_name=author_name, site_description=site_description,
+                base_url=base_url, include_navbar=True, **sentinels
+            )
+            parts = _LAYOUT_SLOT_RE.split(html)
+            skeleton = self._layout_skeletons[key] = (parts, parts[1::2])
+        return skeleton
+    
+    def _page_parts(self, content: str, page_title: str = "", author_name: str = "",
+                    site_description: str = "", base_url: str = "", **context) -> list:
+        """The page as a list of chunks: the layout skeleton with its slots filled in"""
         # built_pages will be available in context
         navbar_html = self.render_component('navbar', author_name=author_name, base_url=base_url, **context)
-        from datetime import datetime
         footer_html = self.render_component('footer', author_name=author_name, current_year=datetime.now().year)
         seo_head_html = self.render_component('seo_head', page_title=page_title, author_name=author_name, site_description=site_description, **context)
         # Render MathJax configuration if provided
         mathjax_config = context.get('mathjax_config')
-        mathjax_html = self.render_component('mathjax', mathjax_config=mathjax_config) if mathjax_config else ""
+        mathjax_html = self.render_component('mathjax', mathjax_config=mathjax_config)
+        
+        slots = {
+            'content': content, 'page_title': str(escape(page_title)),
+            'meta_description': context.get('meta_description') or "",
+            'navbar': navbar_html, 'footer': footer_html,
+            'seo_head': seo_head_html, 'mathjax_html': mathjax_html,
+        }
+        present = tuple(bool(slots[name]) for name in _LAYOUT_SLOTS)
+        parts, names = self._layout_skeleton(base_url, author_name, site_description, present)
         
-        return template.render(
-            content=content, page_title=page_title, author_name=author_name,
-            site_description=site_description, base_url=base_url,
-            navbar=navbar_html, footer=footer_html, seo_head=seo_head_html, mathjax_html=mathjax_html,
-            include_navbar=True, **context
-        )
+        page = list(parts)
+        page[1::2] = [slots[name] for name in names]
+        return page
+    
+    def render_page(self, content: str, **page) -> str:
+        """Override base render_page to handle SEO and built_pages context"""
+        return "".join(self._page_parts(content, **page))
+    
+    def render_page_to_file(self, path: Path, **page) -> None:
+        """Write the page's chunks straight to the file instead of joining them first"""
+        write_chunks(path, self._page_parts(**page))
 
     def write_css_file(self, output_dir):
         """Copy external CSS and JS files"""
@@ -102,8 +137,7 @@ class MinimalTheme(BaseTheme):
         output_css_path = static_dir / "style.css"
         
         if theme_css_path.exists():
-            import shutil
-            shutil.copy2(theme_css_path, output_css_path)
+            copy_file_if_changed(theme_css_path, output_css_path)
         else:
             # Fallback: write basic CSS
             css_content = """/* Minimal theme styles - fallback */
@@ -120,8 +154,7 @@ body {
         output_js_path = static_dir / "theme.js"
         
         if theme_js_path.exists():
-            import shutil
-            shutil.copy2(theme_js_path, output_js_path)
+            copy_file_if_changed(theme_js_path, output_js_path)
     
 
 
@@ -131,24 +164,24 @@ body {
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{% if page_title %}{{ page_title }} · {% endif %}{{ author_name }}</title>
+    <title>{% if page_title %}{{ page_title | e }} · {% endif %}{{ author_name }}</title>
     <meta name="description" content="{% if meta_description %}{{ meta_description }}{% else %}{{ site_description }}{% endif %}">
-    {% if seo_head %}{{ seo_head | safe }}{% endif %}
-    {% if mathjax_html %}{{ mathjax_html | safe }}{% endif %}
+    {% if seo_head %}{{ seo_head }}{% endif %}
+    {% if mathjax_html %}{{ mathjax_html }}{% endif %}
     <link rel="stylesheet" href="{{ file('style.css') }}">
-    <link rel="preconnect" href="https://fonts.googleapis.com">
     <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&family=JetBrains+Mono:wght@400;500&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+    <link rel="preload" as="style" href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&family=JetBrains+Mono:wght@400;500&display=swap" onload="this.onload=null;this.rel='stylesheet'">
+    <link rel="preload" as="style" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css" onload="this.onload=null;this.rel='stylesheet'">
+    <noscript><link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&family=JetBrains+Mono:wght@400;500&display=swap"><link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css"></noscript>
 </head>
 <body>
-    {% if include_navbar %}{{ navbar | safe }}{% endif %}
+    {% if include_navbar %}{{ navbar }}{% endif %}
     
     <main>
-        {{ content | safe }}
+        {{ content }}
     </main>
     
-    {% if include_navbar %}{{ footer | safe }}{% endif %}
+    {% if include_navbar %}{{ footer }}{% endif %}
     
     <script src="{{ file('theme.js') }}"></script>
 </body>
@@ -168,25 +201,31 @@ body {
     </nav>
 </header>"""
 
+    # Fragments with (next to) no logic are str.format strings, not Jinja templates
+    FORMAT_TEMPLATES = {'footer', 'divider'}
+
     FOOTER_TEMPLATE = """<footer class="site-footer-main">
-    <p>© {{ current_year }} {{ author_name }}. All rights reserved.</p>
+    <p>© {current_year} {author_name}. All rights reserved.</p>
 </footer>"""
 
 
 
 
 
+    # The item templates below run once per item on every list page. They use
+    # subscript lookups because items are dicts: Jinja resolves item['x'] with a
+    # direct key lookup, whereas item.x first fails a getattr() on the dict.
     PUBLICATION_ITEM_TEMPLATE = """<article class="card publication-card reveal-on-scroll">
-    <h3 class="card-title">{{ item.title }}</h3>
-    <p class="card-meta pub-authors">{{ item.authors | safe }}</p>
-    <p class="card-meta pub-venue">{{ item.venue }}, {{ item.year }}</p>
+    <h3 class="card-title">{{ item['title'] }}</h3>
+    <p class="card-meta pub-authors">{{ item['authors'] }}</p>
+    <p class="card-meta pub-venue">{{ item['venue'] }}, {{ item['year'] }}</p>
     <div class="card-links">
-    {% if item.links %}
-        {% for link in item.links %}
-        <a href="{{ link.url }}" class="pub-link">{{ link.label | safe }}</a>
+    {% if item['links'] %}
+        {% for link in item['links'] %}
+        <a href="{{ link['url'] }}" class="pub-link">{{ link['label'] }}</a>
         {% endfor %}
     {% endif %}
-        <button class="cite-button" onclick="copyBibtex(this)" data-bibtex="{{ item.bibtex | e }}">
+        <button class="cite-button" onclick="copyBibtex(this)" data-bibtex="{{ item['bibtex'] | e }}">
             <i class="fas fa-quote-left"></i> Cite
         </button>
     </div>
@@ -197,7 +236,7 @@ body {
     NEWS_ITEM_TEMPLATE = """<article class="news-item reveal-on-scroll">
     <time class="news-date">{{ item.date }}</time>
     <div class="news-content">
-        {{ item.content | safe }}
+        {{ item.content }}
     <div class="news-links">
         {% if item.paper %}<a href="{{ item.paper }}" target="_blank" rel="noopener" class="news-link">Paper</a>{% endif %}
         {% if item.code %}<a href="{{ item.code }}" target="_blank" rel="noopener" class="news-link">Code</a>{% endif %}
@@ -210,27 +249,27 @@ body {
 </article>"""
 
     PROJECT_ITEM_TEMPLATE = """<article class="card project-card reveal-on-scroll">
-    <h3 class="card-title">{{ item.title }}</h3>
-    {% if item.category %}
+    <h3 class="card-title">{{ item['title'] }}</h3>
+    {% if item['category'] %}
     <div class="card-meta">
-        <span class="category-tag">{{ item.category }}</span>
+        <span class="category-tag">{{ item['category'] }}</span>
     </div>
     {% endif %}
     <div class="card-content">
-        {{ item.description | safe }}
+        {{ item['description'] }}
     </div>
-    {% if item.collaborators %}
+    {% if item['collaborators'] %}
     <div class="card-meta">
-        <strong>Collaborators:</strong> {{ item.collaborators | join(', ') }}
+        <strong>Collaborators:</strong> {{ item['collaborators'] | join(', ') }}
     </div>
     {% endif %}
     <div class="card-links">
-        {% if item.github %}<a href="{{ item.github }}" target="_blank" rel="noopener" class="card-link">GitHub</a>{% endif %}
-        {% if item.documentation %}<a href="{{ item.documentation }}" target="_blank" rel="noopener" class="card-link">Documentation</a>{% endif %}
-        {% if item.paper %}<a href="{{ item.paper }}" target="_blank" rel="noopener" class="card-link">Paper</a>{% endif %}
-        {% if item.website %}<a href="{{ item.website }}" target="_blank" rel="noopener" class="card-link">Website</a>{% endif %}
-        {% if item.demo %}<a href="{{ item.demo }}" target="_blank" rel="noopener" class="card-link">Demo</a>{% endif %}
-        {% if item.code %}<a href="{{ item.code }}" target="_blank" rel="noopener" class="card-link">Code</a>{% endif %}
+        {% if item['github'] %}<a href="{{ item['github'] }}" target="_blank" rel="noopener" class="card-link">GitHub</a>{% endif %}
+        {% if item['documentation'] %}<a href="{{ item['documentation'] }}" target="_blank" rel="noopener" class="card-link">Documentation</a>{% endif %}
+        {% if item['paper'] %}<a href="{{ item['paper'] }}" target="_blank" rel="noopener" class="card-link">Paper</a>{% endif %}
+        {% if item['website'] %}<a href="{{ item['website'] }}" target="_blank" rel="noopener" class="card-link">Website</a>{% endif %}
+        {% if item['demo'] %}<a href="{{ item['demo'] }}" target="_blank" rel="noopener" class="card-link">Demo</a>{% endif %}
+        {% if item['code'] %}<a href="{{ item['code'] }}" target="_blank" rel="noopener" class="card-link">Code</a>{% endif %}
     </div>
 </article>"""
 
@@ -238,22 +277,22 @@ body {
 
     TALK_ITEM_TEMPLATE = """<article class="card talk-card reveal-on-scroll">
     <h3 class="card-title">
-        {{ item.title }}
-        {% if item.type %}<span class="talk-type">{{ item.type }}</span>{% endif %}
+        {{ item['title'] }}
+        {% if item['type'] %}<span class="talk-type">{{ item['type'] }}</span>{% endif %}
     </h3>
     <p class="card-meta">
-        {% if item.date %}<time>{{ item.date }}</time>{% endif %}
-        {% if item.venue %} · <span class="talk-venue">{{ item.venue }}</span>{% endif %}
+        {% if item['date'] %}<time>{{ item['date'] }}</time>{% endif %}
+        {% if item['venue'] %} · <span class="talk-venue">{{ item['venue'] }}</span>{% endif %}
     </p>
-    {% if item.description %}
-    <div class="card-content">{{ item.description | safe }}</div>
+    {% if item['description'] %}
+    <div class="card-content">{{ item['description'] }}</div>
     {% endif %}
     <div class="card-links">
-        {% if item.slides %}<a href="{{ item.slides }}" target="_blank" rel="noopener" class="card-link">Slides</a>{% endif %}
-        {% if item.video %}<a href="{{ item.video }}" target="_blank" rel="noopener" class="card-link">Video</a>{% endif %}
-        {% if item.code %}<a href="{{ item.code }}" target="_blank" rel="noopener" class="card-link">Code</a>{% endif %}
-        {% if item.materials %}<a href="{{ item.materials }}" target="_blank" rel="noopener" class="card-link">Materials</a>{% endif %}
-        {% if item.demo %}<a href="{{ item.demo }}" target="_blank" rel="noopener" class="card-link">Demo</a>{% endif %}
+        {% if item['slides'] %}<a href="{{ item['slides'] }}" target="_blank" rel="noopener" class="card-link">Slides</a>{% endif %}
+        {% if item['video'] %}<a href="{{ item['video'] }}" target="_blank" rel="noopener" class="card-link">Video</a>{% endif %}
+        {% if item['code'] %}<a href="{{ item['code'] }}" target="_blank" rel="noopener" class="card-link">Code</a>{% endif %}
+        {% if item['materials'] %}<a href="{{ item['materials'] }}" target="_blank" rel="noopener" class="card-link">Materials</a>{% endif %}
+        {% if item['demo'] %}<a href="{{ item['demo'] }}" target="_blank" rel="noopener" class="card-link">Demo</a>{% endif %}
     </div>
 </article>"""
 
@@ -272,7 +311,7 @@ body {
         <time class="post-date">{{ item.date }}</time>
     </header>
     <div class="post-content">
-        {{ item.content | safe }}
+        {{ item.content }}
     </div>
 </article>"""
 
@@ -281,7 +320,7 @@ body {
 
 
     PAGE_TEMPLATE = """<article class="page-content">
-        {{ item.content | safe }}
+        {{ item.content }}
 </article>"""
 
 
@@ -296,6 +335,13 @@ body {
     </div>
 </div>"""
 
+    # Item dispatch macro, compiled into every template that loops over items.
+    # Items reach the templates with their HTML already rendered by the builder,
+    # so the common case is a plain attribute read instead of a nested
+    # render_component call per item.
+    RENDER_ITEM_MACRO = """{% macro render_item(item) %}{% if item.rendered_html is defined and item.rendered_html %}{{ item.rendered_html }}{% else %}{{ theme.render_component(item.template_type, item=item) }}{% endif %}{% endmacro %}
+"""
+
     PAGE_LAYOUT_TEMPLATE = """<div class="container">
     <header class="page-header">
         <h1>{{ title }}</h1>
@@ -311,20 +357,18 @@ body {
         <section class="group-section">
             <h2 class="year-heading">{{ group.group_name }}</h2>
             <div class="list-container">
-                {% for item in group['items'] %}
-                    {{ theme.render_component(item.template_type, item=item) }}
-                {% endfor %}
+                {{ group.items_html }}
             </div>
         </section>
         {% endfor %}
     </div>
     {% elif layout == 'timeline' %}
     <div class="timeline-container">
-        {{ items_html | safe }}
+        {{ items_html }}
     </div>
     {% else %}
     <div class="{% if columns == 2 %}grid-2{% elif columns >= 3 %}grid-3{% else %}list-container{% endif %}">
-        {{ items_html | safe }}
+        {{ items_html }}
     </div>
     {% endif %}
 </div>"""
@@ -336,7 +380,7 @@ body {
     {% if not loop.first %}
         {{ theme.render_component('divider') }}
     {% endif %}
-    {{ section.rendered_html | safe }}
+    {{ section.rendered_html }}
 {% endfor %}"""
 
     PROFILE_HERO_TEMPLATE = """<section class="hero-section">
@@ -364,7 +408,7 @@ body {
     <div class="container">
         <h2>About Me</h2>
         <div class="bio-content">
-            {{ bio_content | safe }}
+            {{ bio_content }}
         </div>
         {% if interests %}
         <div class="interests-section">
@@ -379,7 +423,7 @@ body {
     </div>
 </section>"""
 
-    SECTION_TEMPLATE = """<section class="content-section">
+    SECTION_TEMPLATE = RENDER_ITEM_MACRO + """<section class="content-section">
     <div class="container">
         <header class="section-header">
             <h2>{{ title }}</h2>
@@ -387,11 +431,11 @@ body {
         </header>
         {% if layout|default('grid') == 'timeline' %}
         <div class="timeline-container">
-            {% for item in items %}{{ theme.render_component(item.template_type, item=item) }}{% endfor %}
+            {% for item in items %}{{ render_item(item) }}{% endfor %}
         </div>
         {% else %}
         <div class="{% if grid_cols == 2 %}grid-2{% elif grid_cols >= 3 %}grid-3{% else %}list-container{% endif %}">
-            {% for item in items %}{{ theme.render_component(item.template_type, item=item) }}{% endfor %}
+            {% for item in items %}{{ render_item(item) }}{% endfor %}
         </div>
         {% endif %}
         {% if view_all_link|default(false) %}
@@ -518,7 +562,7 @@ body {
 {% endif %}
 {% if structured_data is defined and structured_data %}
 <script type="application/ld+json">
-{{ structured_data | safe }}
+{{ structured_data }}
 </script>
 {% endif %}"""
 
@@ -565,4 +609,36 @@ body {
     <script id="MathJax-script" async src="{% if mathjax_config.cdn_url %}{{ mathjax_config.cdn_url }}{% else %}https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js{% endif %}"></script>
 {% endif %}"""
 
+    # Component name -> class attribute holding its inline template. Attribute
+    # names rather than the strings themselves, so subclasses can still
+    # override individual templates.
+    _INLINE_TEMPLATES = (
+        # Core layout components
+        ('navbar', 'NAVBAR_TEMPLATE'),
+        ('footer', 'FOOTER_TEMPLATE'),
+        ('page_layout', 'PAGE_LAYOUT_TEMPLATE'),
+        ('landing_page', 'LANDING_PAGE_TEMPLATE'),
+        ('profile_hero', 'PROFILE_HERO_TEMPLATE'),
+        ('bio_section', 'BIO_SECTION_TEMPLATE'),
+        ('section', 'SECTION_TEMPLATE'),
+        ('divider', 'DIVIDER_TEMPLATE'),
+
+        # Item templates
+        ('publication_item', 'PUBLICATION_ITEM_TEMPLATE'),
+        ('project_item', 'PROJECT_ITEM_TEMPLATE'),
+        ('news_item', 'NEWS_ITEM_TEMPLATE'),
+        ('talk_item', 'TALK_ITEM_TEMPLATE'),
+        ('blog_post_item', 'BLOG_POST_ITEM_TEMPLATE'),
+        ('service_item', 'SERVICE_ITEM_TEMPLATE'),
+
+        # Page templates
+        ('blog_post_page', 'BLOG_POST_PAGE_TEMPLATE'),
+        ('page', 'PAGE_TEMPLATE'),
+
+        # Enhanced service templates
+        ('service_section', 'SERVICE_SECTION_TEMPLATE'),
+        ('service_section_header', 'SERVICE_SECTION_HEADER_TEMPLATE'),
+        ('service_group', 'SERVICE_GROUP_TEMPLATE'),
+    )
+
     # CSS is now external - see css/theme.css
@@ -3,6 +3,7 @@ Theme builder for ZenFolio.
 
 This module handles building theme assets (CSS, JS) using appropriate tools.
 """
+import json
 import os
 import subprocess
 from pathlib import Path
@@ -40,16 +41,24 @@ class ThemeBuilder:
             if os.name == "nt":  # Windows
                 npm_path = "npm.cmd"
 
-            result = subprocess.run(
-                [npm_path] + command.split(),
-                cwd=str(cwd or self.theme_dir),
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
             if self.debug:
+                result = subprocess.run(
+                    [npm_path] + command.split(),
+                    cwd=str(cwd or self.theme_dir),
+                    capture_output=True,
+                    text=True,
+                    check=True
+                )
                 print(f"📦 {result.stdout}")
+            else:
+                # npm's output is only ever shown in debug mode, don't pipe and decode it
+                subprocess.run(
+                    [npm_path] + command.split(),
+                    cwd=str(cwd or self.theme_dir),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=True
+                )
             
             return True
             
@@ -87,7 +96,6 @@ class ThemeBuilder:
             bool: True if all dependencies are installed
         """
         try:
-            import json
             with open(self.package_json) as f:
                 package = json.load(f)
                 
@@ -96,8 +104,18 @@ class ThemeBuilder:
                 **package.get("devDependencies", {})
             }
             
+            # One directory listing instead of a stat per dependency. Scoped packages
+            # (@scope/name) live one level down, so list each scope directory once too
+            with os.scandir(self.node_modules) as entries:
+                installed = {entry.name for entry in entries}
+            listed_scopes = set()
             for dep in deps:
-                if not (self.node_modules / dep).exists():
+                scope = dep.partition('/')[0] if dep.startswith('@') else None
+                if scope and scope in installed and scope not in listed_scopes:
+                    with os.scandir(self.node_modules / scope) as entries:
+                        installed.update(f"{scope}/{entry.name}" for entry in entries)
+                    listed_scopes.add(scope)
+                if dep not in installed:
                     return False
             return True
             
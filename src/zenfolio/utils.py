@@ -2,10 +2,26 @@
 Shared utilities for ZenFolio - Common functions used across modules
 """
 
+import os
+import queue
+import shutil
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 from urllib.parse import urljoin
 
 
+_EXTERNAL_URL_PREFIXES = ('http://', 'https://', 'mailto:', 'tel:')
+
+# Scratch buffers for write_chunks, reused across pages instead of allocated per write
+_WRITE_BUFFER_SIZE = 512 * 1024
+_WRITE_BUFFERS = queue.LifoQueue(maxsize=32)
+
+# Flags for output files written with os.open (O_BINARY: no newline translation on Windows)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
 def build_url(base_url: str, path: str) -> str:
     """
     Build URLs that work for both debugging (relative) and deployment (absolute)
@@ -20,16 +36,19 @@ def build_url(base_url: str, path: str) -> str:
     # Clean the path
     clean_path = str(path).lstrip('/')
     
+    # Handle relative URLs (debugging/local) - the most common case, checked first
+    if not base_url or base_url == './':
+        # Simple relative path
+        return clean_path
+    
     # Handle absolute URLs (deployment)
     if base_url.startswith(('http://', 'https://')):
-        # For absolute URLs, use urljoin for proper handling
+        # Plain paths can simply be appended, urljoin is only needed for the rest
+        prefix = _url_prefix(base_url)
+        if prefix is not None and _is_plain_path(clean_path):
+            return prefix + clean_path
         return urljoin(base_url.rstrip('/') + '/', clean_path)
     
-    # Handle relative URLs (debugging/local)
-    if not base_url or base_url in ['', './']:
-        # Simple relative path
-        return clean_path
-    
     # Handle custom relative base (e.g., "../" for nested pages)
     # Use pathlib for proper path joining, then convert to forward slashes for URLs
     result_path = Path(base_url) / clean_path
@@ -37,6 +56,30 @@ def build_url(base_url: str, path: str) -> str:
     return str(result_path).replace('\\', '/')
 
 
+@lru_cache(maxsize=8)
+def _url_prefix(base_url: str) -> Optional[str]:
+    """
+    Base URL with a single trailing slash, or None if urljoin could rewrite it: a query or
+    fragment, or dot segments and empty segments in its path, which urljoin resolves
+    """
+    if '?' in base_url or '#' in base_url:
+        return None
+    path = base_url.partition('://')[2]
+    if '/.' in path or '//' in path:
+        return None
+    return base_url.rstrip('/') + '/'
+
+
+def _is_plain_path(path: str) -> bool:
+    """
+    Whether urljoin would leave the path untouched: no scheme, no dot or empty
+    segments, and none of the whitespace/control characters urlsplit strips
+    """
+    return (':' not in path and './' not in path and '//' not in path
+            and not path.endswith('.') and not path.startswith(' ') and path.isprintable())
+
+
+@lru_cache(maxsize=256)
 def resolve_directory_path(path_str: str, base_dir: Path) -> Path:
     """Resolve a directory path string relative to base directory"""
     if Path(path_str).is_absolute():
@@ -45,11 +88,128 @@ def resolve_directory_path(path_str: str, base_dir: Path) -> Path:
         return base_dir / path_str
 
 
+@lru_cache(maxsize=256)
 def is_external_url(path: str) -> bool:
     """Check if a path is an external URL"""
-    return path.startswith(('http://', 'https://', 'mailto:', 'tel:'))
+    return path.startswith(_EXTERNAL_URL_PREFIXES)
 
 
+@lru_cache(maxsize=256)
 def get_theme_directory(theme_file: str) -> Path:
     """Get the directory containing a theme file"""
     return Path(theme_file).parent
+
+
+def map_bounded(executor, fn, items, max_in_flight: int):
+    """
+    Like executor.map, but with at most max_in_flight tasks submitted at any time
+    
+    executor.map submits every item up front, so all inputs and finished results sit in
+    the executor's queues at once; this keeps a sliding window and yields in input order.
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) >= max_in_flight:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def make_dir(path) -> None:
+    """
+    Create a directory whose parent exists, if it is missing
+    
+    A single mkdir call: unlike Path.mkdir(exist_ok=True) or os.makedirs, nothing is
+    stat'ed first or afterwards.
+    """
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        pass
+
+
+def copy_file(src: Path, dst: Path) -> None:
+    """
+    Copy a file's contents and modification time
+    
+    shutil.copyfile already takes the kernel's zero-copy path where there is one
+    (sendfile on Linux, fcopyfile on macOS). Unlike copy2, only the timestamps are
+    carried over, with one utime call, instead of copying the full stat metadata.
+    """
+    shutil.copyfile(src, dst)
+    st = os.stat(src)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def copy_file_if_changed(src, dst) -> bool:
+    """copy_file unless dst already has src's size and modification time; True if copied"""
+    try:
+        src_stat, dst_stat = os.stat(src), os.stat(dst)
+    except OSError:
+        pass
+    else:
+        if src_stat.st_size == dst_stat.st_size and src_stat.st_mtime_ns == dst_stat.st_mtime_ns:
+            return False
+    copy_file(src, dst)
+    return True
+
+
+def _write_all(fd: int, data) -> None:
+    """Write a bytes-like object to a file descriptor, retrying short writes"""
+    data = memoryview(data)
+    while data:
+        written = os.write(fd, data)
+        data = data[written:]
+
+
+def write_bytes(path, data) -> None:
+    """Write bytes to a file straight through os.write, without a Python file object"""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
+
+
+def write_chunks(path, chunks, encoding: str = 'utf-8') -> None:
+    """
+    Write an iterable of str chunks (e.g. Template.generate()) to a file
+    
+    Chunks are encoded into a fixed-size bytearray borrowed from a small pool and
+    flushed with one write whenever it fills up, so a page costs a handful of
+    syscalls and no per-page buffer allocation.
+    """
+    try:
+        buffer = _WRITE_BUFFERS.get_nowait()
+    except queue.Empty:
+        buffer = bytearray(_WRITE_BUFFER_SIZE)
+    
+    view = memoryview(buffer)
+    try:
+        fd = os.open(path, _WRITE_FLAGS, 0o644)
+        try:
+            pos = 0
+            for chunk in chunks:
+                data = chunk.encode(encoding)
+                end = pos + len(data)
+                if end > _WRITE_BUFFER_SIZE:
+                    _write_all(fd, view[:pos])
+                    pos = 0
+                    if len(data) > _WRITE_BUFFER_SIZE:
+                        _write_all(fd, data)
+                        continue
+                    end = len(data)
+                # Same-length slice assignment never resizes the buffer
+                view[pos:end] = data
+                pos = end
+            if pos:
+                _write_all(fd, view[:pos])
+        finally:
+            os.close(fd)
+    finally:
+        view.release()
+        try:
+            _WRITE_BUFFERS.put_nowait(buffer)
+        except queue.Full:
+            pass
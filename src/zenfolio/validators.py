@@ -1,11 +1,28 @@
 """
 This module contains validation functions for the ZenFolio website generator.
 """
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from .zenfolio import get_output_dir
 
 
+# Internal links with a doubled slash, e.g. href="static//style.css"
+_MALFORMED_URL_RE = re.compile(rb'href="(?!https?://)[^"]*//[^"]*"')
+
+# Below this many pages, starting worker processes costs more than scanning in-process
+_PARALLEL_SCAN_MIN_FILES = 32
+
+
+def _format_section(title: str, items) -> str:
+    """Format a report heading and its bullet points as one block, to print in a single call"""
+    return "\n   • ".join([title, *items])
+
+
 def validate_site(content_dir: Path):
     """Validate configuration and content files"""
     print(f"🔍 Validating academic website in {content_dir}")
@@ -15,15 +32,21 @@ def validate_site(content_dir: Path):
     
     if not content_dir.exists():
         errors.append(f"Content directory '{content_dir}' does not exist")
-        print("❌ Validation failed:")
-        for error in errors:
-            print(f"   • {error}")
+        print(_format_section("❌ Validation failed:", errors))
+        return False
+    
+    # List the content directory once instead of stat-ing each expected file
+    try:
+        with os.scandir(content_dir) as entries:
+            present = {entry.name for entry in entries}
+    except OSError as e:
+        errors.append(f"Content directory '{content_dir}' cannot be read: {e}")
+        print(_format_section("❌ Validation failed:", errors))
         return False
     
     required_files = ["config.py", "index.md", "publications.bib"]
     for filename in required_files:
-        file_path = content_dir / filename
-        if not file_path.exists():
+        if filename not in present:
             errors.append(f"Required file '{filename}' is missing")
     
     try:
@@ -42,8 +65,7 @@ def validate_site(content_dir: Path):
             
         content_files = ["news.py", "projects.py", "talks.py"]
         for filename in content_files:
-            file_path = content_dir / filename
-            if file_path.exists():
+            if filename in present:
                 print(f"✅ Found {filename}")
             else:
                 warnings.append(f"Optional content file '{filename}' is missing")
@@ -58,24 +80,19 @@ def validate_site(content_dir: Path):
     except Exception as e:
         errors.append(f"Unexpected error loading configuration: {e}")
     
-    static_dir = content_dir / "static"
-    if not static_dir.exists():
+    if "static" not in present:
         warnings.append("Static directory is missing")
     else:
-        profile_img = static_dir / "profile.jpg"
+        profile_img = content_dir / "static" / "profile.jpg"
         if not profile_img.exists():
             warnings.append("Profile image (static/profile.jpg) is missing")
     
     if errors:
-        print("❌ Validation failed:")
-        for error in errors:
-            print(f"   • {error}")
+        print(_format_section("❌ Validation failed:", errors))
         return False
     
     if warnings:
-        print("⚠️  Validation passed with warnings:")
-        for warning in warnings:
-            print(f"   • {warning}")
+        print(_format_section("⚠️  Validation passed with warnings:", warnings))
     
     if not warnings:
         print("✅ All validation checks passed!")
@@ -83,6 +100,46 @@ def validate_site(content_dir: Path):
     return len(errors) == 0
 
 
+def _iter_html(root: str):
+    """Yield the paths of all .html files under root, as plain strings"""
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                # Symlinked directories are not followed, so a link loop can't recurse forever
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith('.html'):
+                    yield entry.path
+
+
+def _scan_html(html_file: str, output_dir: str, debug: bool = False):
+    """Check one generated page, returning its (issues, warnings)"""
+    issues = []
+    warnings = []
+    try:
+        # Both checks are plain byte searches, so map the file instead of decoding it
+        with open(html_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return issues, warnings
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                if content.find(b'{static}') != -1:
+                    issues.append(f"Unprocessed {{static}} placeholder in {os.path.relpath(html_file, output_dir)}")
+                
+                # Pages without any '//' can't match, skip the regex scan for them
+                malformed_urls = _MALFORMED_URL_RE.findall(content) if content.find(b'//') != -1 else None
+        
+        if malformed_urls:
+            for url in malformed_urls[:2]:
+                url = url.decode('utf-8', errors='replace')
+                warnings.append(f"Malformed internal URL {url} in {os.path.relpath(html_file, output_dir)}")
+        
+    except Exception as e:
+        if debug:
+            warnings.append(f"Could not read {os.path.relpath(html_file, output_dir)}: {e}")
+    return issues, warnings
+
+
 def validate_generated_site(content_dir: Path, debug: bool = False) -> bool:
     """Validate the generated site for common deployment issues"""
     output_dir = content_dir / get_output_dir(content_dir)
@@ -94,26 +151,22 @@ def validate_generated_site(content_dir: Path, debug: bool = False) -> bool:
     issues_found = []
     warnings_found = []
     
-    html_files = list(output_dir.glob("**/*.html"))
+    html_files = list(_iter_html(str(output_dir)))
     if html_files:
         print(f"🔍 Validating {len(html_files)} HTML files...")
         
-        for html_file in html_files:
-            try:
-                content = html_file.read_text(encoding='utf-8')
-                
-                if '{static}' in content:
-                    issues_found.append(f"Unprocessed {{static}} placeholder in {html_file.relative_to(output_dir)}")
-                
-                import re
-                malformed_urls = re.findall(r'href="(?!https?://)[^"]*//[^"]*"', content)
-                if malformed_urls:
-                    for url in malformed_urls[:2]:
-                        warnings_found.append(f"Malformed internal URL {url} in {html_file.relative_to(output_dir)}")
-                
-            except Exception as e:
-                if debug:
-                    warnings_found.append(f"Could not read {html_file.relative_to(output_dir)}: {e}")
+        scan = partial(_scan_html, output_dir=str(output_dir), debug=debug)
+        if len(html_files) < _PARALLEL_SCAN_MIN_FILES:
+            results = map(scan, html_files)
+        else:
+            # Each page is checked independently; map keeps the results in file order
+            workers = os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(scan, html_files, chunksize=max(1, len(html_files) // (workers * 4))))
+        
+        for issues, warnings in results:
+            issues_found.extend(issues)
+            warnings_found.extend(warnings)
     
     critical_files = ['.nojekyll']
     for file_name in critical_files:
@@ -125,22 +178,18 @@ def validate_generated_site(content_dir: Path, debug: bool = False) -> bool:
         warnings_found.append("Static directory is empty - images/assets may not be copied")
     
     if issues_found:
-        print("❌ CRITICAL ISSUES FOUND:")
-        for issue in issues_found:
-            print(f"   • {issue}")
-        print("🚨 These issues will cause broken functionality on the deployed site!")
+        print(_format_section("❌ CRITICAL ISSUES FOUND:", issues_found) + "\n"
+              "🚨 These issues will cause broken functionality on the deployed site!")
         return False
     
+    report = []
     if warnings_found:
-        print("⚠️  Warnings found:")
-        for warning in warnings_found[:5]:
-            print(f"   • {warning}")
+        report.append(_format_section("⚠️  Warnings found:", warnings_found[:5]))
         if len(warnings_found) > 5:
-            print(f"   ... and {len(warnings_found) - 5} more warnings")
-    
-    if not issues_found and not warnings_found:
-        print("✅ Site validation passed - no issues found!")
-    elif not issues_found:
-        print("✅ Site validation passed with warnings")
+            report.append(f"   ... and {len(warnings_found) - 5} more warnings")
+        report.append("✅ Site validation passed with warnings")
+    else:
+        report.append("✅ Site validation passed - no issues found!")
+    print("\n".join(report))
     
     return True
@@ -3,23 +3,160 @@ ZenFolio - Core generator class for academic websites
 v3.4 - Corrected logic to ensure bio section is included on homepage.
 """
 
+import hashlib
+import importlib.metadata
+import json
+import logging
+import os
+import re
 import shutil
-import markdown
 import textwrap
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
 from .content import Content
 from .parsers import parser_registry
+from .parsers.markdown_parser import MARKDOWN_BACKEND, create_markdown_renderer
 from .themes import TailwindTheme, MinimalTheme
 from .seo_utils import SEOGenerator
-from .utils import resolve_directory_path, is_external_url, build_url
+from .utils import resolve_directory_path, is_external_url, build_url, copy_file, make_dir, map_bounded, write_bytes
 from zencfg import load_config_from_file
 
+try:
+    import orjson
+except ImportError:  # optional, see the 'fast' extra
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+
+# img src attributes with a path relative to the content's images/ folder
+_IMG_SRC_RE = re.compile(r'src="images/([^"]*)"')
+
+# Item fields that might contain file paths or URLs
+_PATH_FIELDS = frozenset({
+    'photo', 'image', 'paper', 'code', 'slides', 'video', 'website', 'demo',
+    'release_notes', 'documentation', 'tutorial_page', 'materials', 'project_page',
+    'github', 'cv'
+})
+
+# Item fields rendered as markdown; service item descriptions are plain text
+_MARKDOWN_KEYS = ('content', 'description', 'excerpt')
+_SERVICE_MARKDOWN_KEYS = ('content', 'excerpt')
+
+# Author fields shown as social links on the homepage: (field, icon, label)
+_SOCIAL_LINKS = (
+    ('github', 'fab fa-github', 'GitHub'),
+    ('scholar', 'fas fa-graduation-cap', 'Google Scholar'),
+    ('linkedin', 'fab fa-linkedin', 'LinkedIn'),
+    ('twitter', 'fab fa-twitter', 'Twitter'),
+)
+
+# Content types whose content is plain markdown: the markdown parser's processor, or the
+# fallback for types no parser claims ('markdown' posts), both dedent, strip and render
+_MARKDOWN_CONTENT_TYPES = frozenset({'markdown', 'blog_post', 'page'})
+
+# Below this many markdown pages, starting worker processes costs more than converting in-process
+_PARALLEL_PAGES_MIN = 32
+
+# Rendered page content, keyed by a hash of its inputs (relative to the content directory)
+_PAGE_CACHE_DIR = Path(".zenfolio-cache") / "pages"
+
+# Bump when the way page content is rendered changes, to invalidate existing cache entries
+_PAGE_CACHE_VERSION = "1"
+
+# Fingerprints of the standalone pages written by the last build (relative to the content directory)
+_PAGE_MANIFEST = Path(".zenfolio-cache") / "manifest.json"
+
+# Output directories kept between builds: static/ is synced and pages/ pruned incrementally
+_KEPT_OUTPUT_DIRS = frozenset({"static", "pages"})
+
+
+def _convert_markdown(content: str, extensions: tuple) -> Optional[str]:
+    """Convert markdown content the way the markdown processor does, or None if it fails"""
+    try:
+        return create_markdown_renderer(extensions)(textwrap.dedent(content).strip())
+    except Exception:
+        return None
+
+
+def _dumps_json(obj) -> bytes:
+    """Compact UTF-8 JSON, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _loads_json(data: bytes):
+    """Parse JSON bytes, with orjson when it is installed; both raise ValueError subclasses"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _remove_entries(entries):
+    """Delete the files and directory trees of os.scandir entries"""
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+
+
+# Distributions whose code shapes the rendered pages: zenfolio itself, the markdown
+# backends, Pygments (codehilite) and nbconvert (notebook pages)
+_RENDERING_DISTRIBUTIONS = ("zenfolio", "Markdown", "markdown-it-pyrs", "mistune", "Pygments", "nbconvert")
+
+
+@lru_cache(maxsize=None)
+def _package_versions() -> str:
+    """Installed versions of the rendering distributions, part of the page cache key"""
+    versions = []
+    for name in _RENDERING_DISTRIBUTIONS:
+        try:
+            versions.append(f"{name}=={importlib.metadata.version(name)}")
+        except importlib.metadata.PackageNotFoundError:
+            versions.append(name)
+    return " ".join(versions)
+
+
+@lru_cache(maxsize=16)
+def _static_url(base_url: str) -> str:
+    """URL of the static folder, which every page of a given depth shares"""
+    return build_url(base_url, 'static')
+
+
+@lru_cache(maxsize=16)
+def _static_image_replacement(base_url: str) -> str:
+    """_IMG_SRC_RE replacement pointing images/ at the static folder"""
+    # Backslashes in the prefix would otherwise be read as escapes in the template
+    static_prefix = _static_url(base_url).rstrip('/') + '/'
+    return 'src="' + static_prefix.replace('\\', '\\\\') + r'images/\1"'
+
+
+@lru_cache(maxsize=8192)
+def _resolve_path(path: str) -> str:
+    """Resolve any path - external URLs as-is, local paths as clean filenames"""
+    if is_external_url(path):
+        return path  # External URL - use as-is
+    # Local file - return clean filename, let templates handle URL generation
+    # (slicing rather than str.removeprefix, which needs Python 3.9)
+    if path.startswith('static/'):
+        return path[7:]
+    return path
+
+
 class ZenFolio:
     """ZenFolio - minimal and powerful academic website generator"""
     
+    # multiprocessing context of the page conversion workers; None uses the platform
+    # default. A forkserver context with preloaded modules avoids re-importing them
+    # in every worker when builds are run repeatedly (tests, benchmarks)
+    mp_context = None
+    
     def __init__(self, content_dir: Path = Path("."), theme_override: str = None, debug: bool = False):
         self.content_dir = content_dir
         self.debug = debug
@@ -34,49 +171,59 @@ class ZenFolio:
         # Resolve paths using shared utilities
         self.static_dir = resolve_directory_path(self.config.static_path, self.content_dir)
         self.output_dir = resolve_directory_path(self.config.output_path, self.content_dir.parent)
+        self.page_cache_dir = self.content_dir / _PAGE_CACHE_DIR
+        self.page_manifest_path = self.content_dir / _PAGE_MANIFEST
         self.theme = self._load_theme(debug=debug)
         self.parser_registry = parser_registry
         
         # Initialize content loader
-        self.content = Content(content_dir, self.config, debug)
+        self.content = Content(content_dir, self.config)
 
         # Initialize SEO utilities and sitemap tracking
         self.seo_pages = []  # Track pages for sitemap generation
+        self._seo_paths = set()  # Paths already in seo_pages
+        self._build_date = datetime.now().strftime('%Y-%m-%d')  # Sitemap lastmod, refreshed by build()
+        
+        # Rendered content fields, keyed by (content_type, source), and the content
+        # processors available for each content type
+        self._content_cache = {}
+        self._content_processors = {}
+        
+        # Rendered HTML and schema per source item, reset on each build
+        self._render_cache = {}
+        
+        # Markdown renderer for the configured extensions, shared by every page and post
+        self._md = create_markdown_renderer(tuple(self.config.site.markdown_extensions))
+        self._cache_page_context()
+    
+    def _cache_page_context(self):
+        """Read the config values that every page is rendered with once, instead of per page"""
+        author_data = self.config.author.to_dict()
+        self._resolve_item_paths(author_data)
+        self._page_context = {
+            'author_name': self.config.author.name,
+            'site_description': self.config.site.description,
+            'author': author_data,
+            'site_seo': self.config.site.seo,  # SEO config for the templates
+            'mathjax_config': self.config.mathjax,  # MathJax config for the templates
+        }
     
 
     
     def _resolve_path(self, path: str) -> str:
         """Resolve any path - external URLs as-is, local paths as clean filenames"""
-        if is_external_url(path):
-            return path  # External URL - use as-is
-        else:
-            # Local file - return clean filename, let templates handle URL generation
-            return path.removeprefix('static/')
+        return _resolve_path(path)
     
     def _process_static_placeholders(self, content: str, base_url: str = "") -> str:
         """Process {static} placeholders and relative image paths in content"""
-        import re
-        
         # First handle {static} placeholders
         if '{static}' in content:
-            static_url = build_url(base_url, 'static')
-            content = content.replace('{static}', static_url)
+            content = content.replace('{static}', _static_url(base_url))
         
         # Handle relative image paths (images/filename.ext -> ../static/images/filename.ext)
-        # This regex matches img src attributes with relative paths starting with "images/"
-        def replace_relative_images(match):
-            current_src = match.group(1)
-            if not current_src.startswith(('http://', 'https://', '//', '../', 'data:', 'static/')):
-                if current_src.startswith('images/'):
-                    # Convert images/file.ext to proper static path
-                    static_url = build_url(base_url, f'static/{current_src}')
-                    return f'src="{static_url}"'
-            return match.group(0)  # Return unchanged if not a relative image path
-        
-        # Apply the replacement to img src attributes
-        content = re.sub(r'src="([^"]+)"', replace_relative_images, content)
-        
-        return content
+        if 'src="images/' not in content:
+            return content
+        return _IMG_SRC_RE.sub(_static_image_replacement(base_url), content)
     
 
     def _load_theme(self, debug=False):
@@ -93,13 +240,26 @@ class ZenFolio:
 
 
 
-    def _process_items(self, items: List[Any], item_type: str, seo_generator: Optional['SEOGenerator'] = None) -> List[Dict[str, Any]]:
+    def _process_items(self, items: List[Any], item_type: str, seo_generator: Optional['SEOGenerator'] = None, base_url: str = "") -> List[Dict[str, Any]]:
         """Process items with optimized markdown rendering and path resolution"""
         if not items:
             return []
             
+        # Everything that only depends on item_type is decided once per list
+        markdown_keys = _SERVICE_MARKDOWN_KEYS if item_type == 'service_item' else _MARKDOWN_KEYS
+        blog_list = item_type == 'blog_post_item'
+        generate_schema = None
+        if seo_generator:
+            if item_type == 'publication_item':
+                generate_schema = seo_generator.generate_scholarly_article_schema
+            elif item_type == 'project_item':
+                generate_schema = seo_generator.generate_software_application_schema
+        
+        render_component = self.theme.render_component
+        process_content_field = self._process_content_field
+        render_cache = self._render_cache
+        seo_id = id(seo_generator)
         processed = []
-        markdown_keys = ['content', 'description', 'excerpt']
         
         for item in items:
             # Handle both dicts (from parsers) and ZenCFG objects (from config)
@@ -119,64 +279,58 @@ class ZenFolio:
             
             # Process content fields using appropriate parser processors
             content_type = item_dict.get('content_type', item_type)
-            skip_content_processing = (item_type == 'blog_post_item') or (content_type == 'blog_post_item')
+            # For blog posts, defer 'content' processing to the dedicated blog page pass
+            skip_content_processing = blog_list or content_type == 'blog_post_item'
             for key in markdown_keys:
                 value = item_dict.get(key)
                 if value and isinstance(value, str):
-                    # For blog posts, defer 'content' processing to the dedicated blog page pass
                     if skip_content_processing and key == 'content':
                         continue
-                    # Skip markdown processing for service item descriptions (they should be plain text)
-                    if item_type == 'service_item' and key == 'description':
-                        continue
                     # Find appropriate processor for this content type
-                    processed_content = self._process_content_field(value, content_type, key)
-                    
                     # Note: Bold text highlighting removed - only timeline dot should pulse
-                    
-                    item_dict[key] = processed_content
+                    item_dict[key] = process_content_field(value, content_type, key)
             
             # Store template name separately to avoid conflict with item.type field
-            item_dict['template_type'] = item_dict.get('template_name') or item_type
+            template_type = item_dict['template_type'] = item_dict.get('template_name') or item_type
             
+            # Items shown on both the homepage and a list page are rendered once; the
+            # cached entry keeps the item alive so its id cannot be reused
+            cache_key = (template_type, item_type, id(item), seo_id, base_url)
+            cached = render_cache.get(cache_key)
+            if cached is not None:
+                item_dict['rendered_html'], item_dict['rendered_schema'] = cached[1:]
+                processed.append(item_dict)
+                continue
             
             # Pre-render the HTML for this item to avoid complex template calls
-            if item_dict['template_type']:
-                item_dict['rendered_html'] = self.theme.render_component(
-                    item_dict['template_type'], 
+            if template_type:
+                item_dict['rendered_html'] = render_component(
+                    template_type, 
                     item=item_dict,
-                    seo_generator=seo_generator
+                    seo_generator=seo_generator,
+                    base_url=base_url
                 )
             
             # Generate schema if possible
-            item_dict['rendered_schema'] = ''
-            if seo_generator:
-                if item_type == 'publication_item':
-                    item_dict['rendered_schema'] = seo_generator.generate_scholarly_article_schema(item_dict)
-                elif item_type == 'project_item':
-                    item_dict['rendered_schema'] = seo_generator.generate_software_application_schema(item_dict)
-
+            item_dict['rendered_schema'] = generate_schema(item_dict) if generate_schema else ''
+            
+            render_cache[cache_key] = (item, item_dict.get('rendered_html'), item_dict['rendered_schema'])
             processed.append(item_dict)
         return processed
     
-    def _process_service_items(self, items: List[Any], seo_generator: Optional['SEOGenerator'] = None) -> Dict[str, Any]:
+    def _process_service_items(self, items: List[Any], seo_generator: Optional['SEOGenerator'] = None, base_url: str = "") -> Dict[str, Any]:
         """Process academic service items, grouping them for structured display."""
-        leadership_items = self._process_items(
-            [item for item in items if item.category == 'leadership'], 'service_item', seo_generator
-        )
+        # Split in one pass; all non-leadership items are review items (conference, journal, etc.)
+        leadership_raw, review_raw = [], []
+        for item in items:
+            (leadership_raw if item.category == 'leadership' else review_raw).append(item)
         
-        # Include all non-leadership items as review items (conference, journal, etc.)
-        review_items = self._process_items(
-            [item for item in items if item.category != 'leadership'], 'service_item', seo_generator
-        )
+        leadership_items = self._process_items(leadership_raw, 'service_item', seo_generator, base_url)
         
         review_groups = {}
-        for item in review_items:
+        for item in self._process_items(review_raw, 'service_item', seo_generator, base_url):
             # Group by description (e.g., "Area Chair", "Reviewer")
-            group_name = item.get('description', 'Other').strip()
-            if group_name not in review_groups:
-                review_groups[group_name] = []
-            review_groups[group_name].append(item)
+            review_groups.setdefault(item.get('description', 'Other').strip(), []).append(item)
             
         return {
             "leadership_items": leadership_items,
@@ -195,52 +349,80 @@ class ZenFolio:
         Returns:
             Processed content string
         """
-        # Find parsers that can handle this content type
-        suitable_parsers = self.parser_registry.get_parsers_for_content_type(content_type)
+        # The same descriptions and posts feed both the homepage and the list pages
+        key = (content_type, content)
+        processed = self._content_cache.get(key)
+        if processed is None:
+            processed = self._content_cache[key] = self._convert_content_field(content, content_type, field_name)
+        return processed
+    
+    def _get_content_processors(self, content_type: str) -> List[tuple]:
+        """(parser, processor) pairs able to handle a content type, looked up once per type"""
+        processors = self._content_processors.get(content_type)
+        if processors is None:
+            processors = []
+            for parser in self.parser_registry.get_parsers_for_content_type(content_type):
+                processor = parser.get_content_processor(content_type)
+                if processor:
+                    processors.append((parser, processor))
+            self._content_processors[content_type] = processors
+        return processors
+    
+    def _convert_content_field(self, content: str, content_type: str, field_name: str) -> str:
+        """Run a content field through the first processor that succeeds, or plain markdown"""
+        # Markdown posts and pages go straight to the shared renderer; this is what the
+        # markdown processor would do, minus the dispatch
+        if content_type in _MARKDOWN_CONTENT_TYPES and field_name == 'content':
+            try:
+                return self._md(textwrap.dedent(content).strip())
+            except Exception as e:
+                log.debug("⚠️  Warning: Failed to process %s as markdown: %s", field_name, e)
         
-        # Try to get a processor from each suitable parser
-        for parser in suitable_parsers:
-            processor = parser.get_content_processor(content_type)
-            if processor:
-                try:
-                    return processor(content, self.config.site.markdown_extensions)
-                except Exception as e:
-                    if self.debug:
-                        print(f"⚠️  Warning: Failed to process {field_name} with {parser.__class__.__name__}: {e}")
-                    continue
+        # Try the processor of each parser that can handle this content type
+        for parser, processor in self._get_content_processors(content_type):
+            try:
+                return processor(content, self.config.site.markdown_extensions)
+            except Exception as e:
+                log.debug("⚠️  Warning: Failed to process %s with %s: %s", field_name, parser.__class__.__name__, e)
+                continue
         
         # Fallback to basic markdown processing
         try:
             normalized_content = textwrap.dedent(content).strip()
-            return markdown.markdown(normalized_content, extensions=self.config.site.markdown_extensions)
+            return self._md(normalized_content)
         except Exception as e:
-            if self.debug:
-                print(f"⚠️  Warning: Failed to process {field_name} with fallback markdown: {e}")
+            log.debug("⚠️  Warning: Failed to process %s with fallback markdown: %s", field_name, e)
             return content  # Return original content if all processing fails
 
     def _resolve_item_paths(self, item_dict: Dict[str, Any]) -> None:
         """Resolve path strings in content items - simple and consistent"""
-        # Fields that might contain file paths or URLs
-        path_fields = {'photo', 'image', 'paper', 'code', 'slides', 'video', 'website', 'demo', 
-                      'release_notes', 'documentation', 'tutorial_page', 'materials', 'project_page', 
-                      'github', 'cv'}
-        
-        for key, value in list(item_dict.items()):
-            if key in path_fields and value and isinstance(value, str):
+        for key in _PATH_FIELDS.intersection(item_dict):
+            value = item_dict[key]
+            if value and isinstance(value, str):
                 try:
                     item_dict[key] = self._resolve_path(value)
                 except Exception as e:
-                    if self.debug:
-                        print(f"⚠️  Warning: Failed to resolve path for {key}: {e}")
+                    log.debug("⚠️  Warning: Failed to resolve path for %s: %s", key, e)
                     item_dict[key] = None
 
     def build(self, base_url: str = ""):
         """Build the static site"""
         print("🔨 Building ZenFolio academic website...")
+        self._build_date = datetime.now().strftime('%Y-%m-%d')
+        self._cache_page_context()
+        # Rendered fields of the previous build's sources; a long-running server would
+        # otherwise keep every edited version
+        self._content_cache.clear()
         
-        # Clean and create output directory
+        # Clean and create output directory; static/ and pages/ are kept and updated incrementally
         if self.output_dir.exists(): 
-            shutil.rmtree(self.output_dir)
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _KEPT_OUTPUT_DIRS:
+                            shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         # Copy static files
@@ -259,6 +441,7 @@ class ZenFolio:
         
         # Parse content
         self.content.load()
+        self._render_cache.clear()
         
         # Initialize SEO generator with configured base_url for absolute URLs
         seo_generator = SEOGenerator(self.config, self.config.site.base_url)
@@ -266,52 +449,45 @@ class ZenFolio:
         # Build pages and track which ones exist for navigation
         print("🏗️ Building pages...")
         
-        # Determine which pages will be built BEFORE building them
-        built_pages = [('publications', 'Publications')]  # Always include publications
-        
-        if self.config.projects and hasattr(self.config.projects, 'items') and self.config.projects.items:
-            built_pages.append(('projects', 'Projects'))
-            
-        if self.config.talks and hasattr(self.config.talks, 'items') and self.config.talks.items:
-            built_pages.append(('talks', 'Talks'))
-            
-        if self.config.news and hasattr(self.config.news, 'items') and self.config.news.items:
-            built_pages.append(('news', 'News'))
-            
-        if self.content.blog_posts and self.config.site.blog_folder:
-            built_pages.append(('blog', 'Blog'))
+        # List pages in build order: (id, title, items, item type, columns, page options)
+        page_specs = [
+            ('publications', 'Publications', self.content.publications, 'publication_item', 1, {'group_by': 'year', 'has_search': True}),
+            ('projects', 'Projects', getattr(self.config.projects, 'items', None), 'project_item', 2, {}),
+            ('talks', 'Talks', getattr(self.config.talks, 'items', None), 'talk_item', 1, {}),
+            ('news', 'News', getattr(self.config.news, 'items', None), 'news_item', 1, {'layout': 'timeline'}),
+            ('blog', 'Blog', self.content.blog_posts if self.config.site.blog_folder else None, 'blog_post_item', 2, {}),
+        ]
+        # Publications are always built, the other pages only if they have content
+        built_specs = [spec for spec in page_specs if spec[0] == 'publications' or spec[2]]
         
         # Store built pages for navbar rendering (before building pages)
-        self.built_pages = built_pages
+        self.built_pages = [(page_id, title) for page_id, title, *_ in built_specs]
         
         # Now build the pages
-        self._build_home_page(self.content.publications, self.content.bio, base_url, seo_generator)
-        self._build_list_page("Publications", "publications.html", self.content.publications, 'publication_item', 1, base_url, group_by='year', has_search=True, seo_generator=seo_generator)
+        # Process the items of all list pages once, up front; the homepage sections
+        # are subsets of these lists
+        processed = {
+            page_id: self._process_items(items, item_type, seo_generator, base_url)
+            for page_id, _, items, item_type, _, _ in built_specs
+        }
         
-        # Conditionally build pages only if content exists
-        if self.config.projects and hasattr(self.config.projects, 'items') and self.config.projects.items:
-            self._build_list_page("Projects", "projects.html", self.config.projects.items, 'project_item', 2, base_url, seo_generator=seo_generator)
-        else:
-            print("⏭️  Skipping Projects page (no content provided)")
-            
-        if self.config.talks and hasattr(self.config.talks, 'items') and self.config.talks.items:
-            self._build_list_page("Talks", "talks.html", self.config.talks.items, 'talk_item', 1, base_url, seo_generator=seo_generator)
-        else:
-            print("⏭️  Skipping Talks page (no content provided)")
-            
-        if self.config.news and hasattr(self.config.news, 'items') and self.config.news.items:
-            self._build_list_page("News", "news.html", self.config.news.items, 'news_item', 1, base_url, layout='timeline', seo_generator=seo_generator)
-        else:
-            print("⏭️  Skipping News page (no content provided)")
+        self._build_home_page(processed['publications'], self.content.bio, base_url, seo_generator,
+                              projects=processed.get('projects', []), news=processed.get('news', []))
+        
+        for page_id, title, items, item_type, columns, options in page_specs:
+            if page_id not in processed:
+                if page_id != 'blog':
+                    print(f"⏭️  Skipping {title} page (no content provided)")
+                elif not self.config.site.blog_folder:
+                    print("⏭️  Skipping Blog pages (blog disabled in configuration)")
+                else:
+                    print("⏭️  Skipping Blog pages (no content provided)")
+                continue
             
-        if self.content.blog_posts and self.config.site.blog_folder:
-            self._build_list_page("Blog", "blog.html", self.content.blog_posts, 'blog_post_item', 2, base_url, seo_generator=seo_generator)
-            self._build_blog_post_pages(self.content.blog_posts, base_url, seo_generator)
-        else:
-            if not self.config.site.blog_folder:
-                print("⏭️  Skipping Blog pages (blog disabled in configuration)")
-            else:
-                print("⏭️  Skipping Blog pages (no content provided)")
+            self._build_list_page(title, f"{page_id}.html", items, item_type, columns, base_url,
+                                  seo_generator=seo_generator, processed_items=processed[page_id], **options)
+            if page_id == 'blog':
+                self._build_blog_post_pages(items, base_url, seo_generator)
         
         self._build_pages(base_url, seo_generator)
         
@@ -325,14 +501,53 @@ class ZenFolio:
     def _copy_static_files(self):
         """Copy static files with optimization for incremental builds"""
         target_static_dir = self.output_dir / "static"
+        # The theme writes its assets next to the site's files after this sync
+        keep = self.theme.STATIC_ASSETS
         
         if not self.static_dir or not self.static_dir.exists():
+            if target_static_dir.exists():
+                with os.scandir(target_static_dir) as entries:
+                    _remove_entries(entry for entry in entries if entry.name not in keep)
             return
-            
-        if target_static_dir.exists():
-            shutil.rmtree(target_static_dir)
         
-        shutil.copytree(self.static_dir, target_static_dir)
+        self._copy_static_incremental(str(self.static_dir), str(target_static_dir), keep=keep)
+    
+    def _copy_static_incremental(self, src: str, dst: str, dst_exists: bool = False, keep=()):
+        """
+        Mirror src into dst, copying only files that are new or changed since the last build
+        
+        Files are compared by size and modification time, which copy_file carries over;
+        anything in dst that is no longer in src is removed, except the names in keep
+        (top level only). Subdirectories already seen in the listing of their parent are
+        not created again.
+        """
+        if not dst_exists:
+            make_dir(dst)
+        with os.scandir(dst) as entries:
+            existing = {entry.name: entry for entry in entries}
+        
+        with os.scandir(src) as entries:
+            for entry in entries:
+                target = existing.pop(entry.name, None)
+                dst_path = os.path.join(dst, entry.name)
+                if entry.is_dir():
+                    target_is_dir = target is not None and target.is_dir(follow_symlinks=False)
+                    if target is not None and not target_is_dir:
+                        os.unlink(dst_path)
+                    self._copy_static_incremental(entry.path, dst_path, dst_exists=target_is_dir)
+                    continue
+                
+                if target is not None:
+                    if target.is_dir(follow_symlinks=False):
+                        shutil.rmtree(dst_path)
+                    else:
+                        src_stat, dst_stat = entry.stat(), target.stat(follow_symlinks=False)
+                        if src_stat.st_size == dst_stat.st_size and src_stat.st_mtime_ns == dst_stat.st_mtime_ns:
+                            continue
+                copy_file(entry.path, dst_path)
+        
+        # Remove files deleted from the source since the last build
+        _remove_entries(entry for name, entry in existing.items() if name not in keep)
 
     def _render_and_write_page(self, filename: str, content: str, page_title: str = "", base_url: str = "", 
                               seo_generator: Optional['SEOGenerator'] = None, page_type: str = "page", 
@@ -341,32 +556,20 @@ class ZenFolio:
         default_current_page = filename.split('.')[0]
         current_page = context.pop('current_page', default_current_page)
         
-        # Process author config for template rendering
-        author_data = self.config.author.to_dict()
-        self._resolve_item_paths(author_data)
+        page_context = self._page_context
         
         # Generate SEO metadata if SEO generator is provided
         seo_context = {
             'canonical_url': None,
             'og_image': None,
-            'meta_description': self.config.site.description,
+            'meta_description': page_context['site_description'],
             'structured_data': None
         }
         if structured_data_list:
             seo_context['structured_data'] = structured_data_list
         
         if seo_generator:
-            # Add page to sitemap tracking (avoid duplicates)
-            if not any(page['path'] == filename for page in self.seo_pages):
-                priority = "1.0" if filename == "index.html" else "0.8" if filename in ["publications.html", "projects.html"] else "0.6"
-                changefreq = "weekly" if filename == "index.html" else "monthly"
-                
-                self.seo_pages.append({
-                    'path': filename,
-                    'priority': priority,
-                    'changefreq': changefreq,
-                    'lastmod': datetime.now().strftime('%Y-%m-%d')
-                })
+            self._track_seo_page(filename)
             
             # Generate meta description
             meta_description = seo_generator.generate_meta_description(page_type, item_data)
@@ -390,17 +593,31 @@ class ZenFolio:
                 elif page_type == "blog_post" and item_data:
                     seo_context['structured_data'] = seo_generator.generate_blog_posting_schema(item_data)
         
-        html = self.theme.render_page(
-            content=content, page_title=page_title, author_name=self.config.author.name,
-            site_description=self.config.site.description, base_url=base_url,
-            current_page=current_page, author=author_data, built_pages=getattr(self, 'built_pages', []),
-            site_seo=self.config.site.seo,  # Add SEO config to template context
-            mathjax_config=self.config.mathjax,  # Add MathJax config to template context
-            **seo_context, **context
+        self.theme.render_page_to_file(
+            # Plain strings: no Path objects built per page
+            os.path.join(os.fspath(self.output_dir), filename),
+            content=content, page_title=page_title, base_url=base_url,
+            current_page=current_page, built_pages=getattr(self, 'built_pages', []),
+            **page_context, **seo_context, **context
         )
-        (self.output_dir / filename).write_text(html, encoding='utf-8')
 
-    def _build_home_page(self, publications: List[Dict], bio_data: Dict, base_url: str, seo_generator: Optional['SEOGenerator'] = None):
+    def _track_seo_page(self, filename: str):
+        """Add a page to sitemap tracking (avoiding duplicates)"""
+        if filename not in self._seo_paths:
+            self._seo_paths.add(filename)
+            priority = "1.0" if filename == "index.html" else "0.8" if filename in ["publications.html", "projects.html"] else "0.6"
+            changefreq = "weekly" if filename == "index.html" else "monthly"
+            
+            self.seo_pages.append({
+                'path': filename,
+                'priority': priority,
+                'changefreq': changefreq,
+                'lastmod': self._build_date
+            })
+
+    def _build_home_page(self, publications: List[Dict], bio_data: Dict, base_url: str, seo_generator: Optional['SEOGenerator'] = None,
+                         projects: List[Dict] = (), news: List[Dict] = ()):
+        """Build index.html from already processed publications, projects and news items"""
         hero_data = self.config.author.to_dict()
         self._resolve_item_paths(hero_data)
         
@@ -416,15 +633,12 @@ class ZenFolio:
                 }
                 for btn in (self.config.author.homepage_buttons or [])
             ],
+            # Social links, skipping those with no URL
             'social_links': [
-                {'url': hero_data.get('github'), 'icon': 'fab fa-github', 'label': 'GitHub'},
-                {'url': hero_data.get('scholar'), 'icon': 'fas fa-graduation-cap', 'label': 'Google Scholar'},
-                {'url': hero_data.get('linkedin'), 'icon': 'fab fa-linkedin', 'label': 'LinkedIn'},
-                {'url': hero_data.get('twitter'), 'icon': 'fab fa-twitter', 'label': 'Twitter'},
+                {'url': hero_data[key], 'icon': icon, 'label': label}
+                for key, icon, label in _SOCIAL_LINKS if hero_data.get(key)
             ]
         })
-        # Filter out social links with no URL
-        hero_data['social_links'] = [link for link in hero_data['social_links'] if link['url']]
         
         # Select publications for homepage: prioritize highlighted, then recent
         highlighted_pubs = [pub for pub in publications if pub.get('highlight', False)]
@@ -445,39 +659,37 @@ class ZenFolio:
         pub_section_title = "Selected Publications" if highlighted_pubs else "Recent Publications"
         
         # Select highlighted projects/research for homepage
-        highlighted_projects = [item for item in self.config.projects.items if getattr(item, 'highlight', False)]
+        highlighted_projects = [item for item in projects if item.get('highlight', False)]
+        
+        news_count = self.config.site.homepage_news_count
         
         # This list declaratively controls the homepage layout AFTER the hero.
         sections = [
             {"id": "bio", "data": {
                 "title": "About Me", 
                 "layout": "bio",
-                "content": markdown.markdown(bio_data.get('bio',''), extensions=self.config.site.markdown_extensions),
+                "content": self._md(bio_data.get('bio','')),
                 "interests": hero_data.get('interests', [])
             }},
             {"id": "featured_work", "data": {
                 "title": "Featured Work", "grid_cols": 2,
                 "subtitle": "A selection of projects and research I'm particularly proud of.",
-                "items": self._process_items(highlighted_projects, 'project_item', seo_generator=seo_generator),
+                "items": highlighted_projects,
                 "view_all_link": {"url": "projects.html", "text": "View all projects"}
             }},
             {"id": "academic_service", "data": {
                 "title": "Academic Service", 
                 "layout": "service",
-                "items": self._process_service_items(self.config.author.service, seo_generator=seo_generator),
+                "items": self._process_service_items(self.config.author.service, seo_generator=seo_generator, base_url=base_url),
             }},
             {"id": "recent_publications", "data": {
                 "title": pub_section_title, "grid_cols": 1,
-                "items": self._process_items(homepage_pubs, 'publication_item', seo_generator=seo_generator),
+                "items": homepage_pubs,
                 "view_all_link": {"url": "publications.html", "text": "View all publications"}
             }},
             {"id": "recent_news", "data": {
                 "title": "Recent News", "layout": "timeline",
-                "items": self._process_items(
-                    self.config.news.items[:self.config.site.homepage_news_count] if self.config.site.homepage_news_count is not None else self.config.news.items, 
-                    'news_item',
-                    seo_generator=seo_generator
-                ),
+                "items": list(news[:news_count] if news_count is not None else news),
                 "view_all_link": {"url": "news.html", "text": "View all news"}
             }}
         ]
@@ -498,8 +710,7 @@ class ZenFolio:
                 has_content = bool(section_data.get('items') or section_data.get('content'))
 
             if not has_content:
-                if self.debug:
-                    print(f"⚠️ Skipping empty section: {section_id}")
+                log.debug("⚠️ Skipping empty section: %s", section_id)
                 continue
                 
             # Render the section
@@ -507,21 +718,19 @@ class ZenFolio:
             
             # Validate the rendered HTML is not empty
             if not section_html or section_html.strip() == "":
-                if self.debug:
-                    print(f"⚠️ Section '{section_id}' rendered as empty HTML")
-                    if section_data.get('items'):
-                        print(f"   Items count: {len(section_data['items'])}")
-                        first_item = section_data['items'][0] if section_data['items'] else None
-                        if first_item and hasattr(first_item, 'get'):
-                            print(f"   First item template_type: {first_item.get('template_type', 'unknown')}")
-                            print(f"   First item rendered_html length: {len(first_item.get('rendered_html', ''))}")
+                log.debug("⚠️ Section '%s' rendered as empty HTML", section_id)
+                if section_data.get('items') and log.isEnabledFor(logging.DEBUG):
+                    log.debug("   Items count: %d", len(section_data['items']))
+                    first_item = section_data['items'][0]
+                    if hasattr(first_item, 'get'):
+                        log.debug("   First item template_type: %s", first_item.get('template_type', 'unknown'))
+                        log.debug("   First item rendered_html length: %d", len(first_item.get('rendered_html', '')))
                 continue
                 
             section_data['rendered_html'] = section_html
             rendered_sections.append(section_data)
             
-        if self.debug:
-            print(f"📊 Homepage sections: {len(sections)} defined, {len(rendered_sections)} rendered")
+        log.debug("📊 Homepage sections: %d defined, %d rendered", len(sections), len(rendered_sections))
         
         # Render the landing page by passing the hero and the list of rendered sections
         content = self.theme.render_component(
@@ -532,9 +741,10 @@ class ZenFolio:
         self._render_and_write_page("index.html", content, page_title=self.config.site.title, base_url=base_url, 
                                    seo_generator=seo_generator, page_type="homepage")
 
-    def _build_list_page(self, title: str, filename: str, items: List[Any], item_type: str, columns: int, base_url: str, layout: str = 'grid', group_by: Optional[str] = None, has_search: bool = False, seo_generator: Optional['SEOGenerator'] = None):
+    def _build_list_page(self, title: str, filename: str, items: List[Any], item_type: str, columns: int, base_url: str, layout: str = 'grid', group_by: Optional[str] = None, has_search: bool = False, seo_generator: Optional['SEOGenerator'] = None, processed_items: Optional[List[Dict[str, Any]]] = None):
         """Generic function to build list pages (Publications, News, etc.)."""
-        processed_items = self._process_items(items, item_type, seo_generator)
+        if processed_items is None:
+            processed_items = self._process_items(items, item_type, seo_generator, base_url)
         
         # This data will be passed to the page_layout.html.j2 template
         page_data = {
@@ -548,15 +758,20 @@ class ZenFolio:
             for item in processed_items:
                 key = item.get(group_by)
                 if key:
-                    if key not in grouped_items: grouped_items[key] = []
-                    grouped_items[key].append(item)
+                    grouped_items.setdefault(key, []).append(item)
             
             try: # Sort years numerically, descending
                 sorted_keys = sorted(grouped_items.keys(), key=int, reverse=True)
             except (ValueError, TypeError): # Fallback for non-numeric keys
                 sorted_keys = sorted(grouped_items.keys(), reverse=True)
                 
-            page_data['grouped_items'] = [{'group_name': key, 'items': grouped_items[key]} for key in sorted_keys]
+            # Items in a group share a template, so join their pre-rendered HTML
+            # here rather than dispatching per item inside the layout template
+            page_data['grouped_items'] = [
+                {'group_name': key, 'items': grouped_items[key],
+                 'items_html': "".join([item['rendered_html'] for item in grouped_items[key]])}
+                for key in sorted_keys
+            ]
         else:
             # For non-grouped pages, pre-render the HTML for each item
             page_data['items_html'] = "".join([item['rendered_html'] for item in processed_items])
@@ -570,8 +785,9 @@ class ZenFolio:
             page_type = "publications"
 
         # Extract all schemas and combine them
-        all_schemas = [item['rendered_schema'] for item in processed_items if item.get('rendered_schema')]
-        combined_schema = f"[{','.join(all_schemas)}]" if all_schemas else None
+        # (str.join builds a sequence from its argument anyway, so a list is the cheapest input)
+        joined_schemas = ','.join([item['rendered_schema'] for item in processed_items if item.get('rendered_schema')])
+        combined_schema = f"[{joined_schemas}]" if joined_schemas else None
 
         self._render_and_write_page(
             filename, content, page_title=title,
@@ -581,18 +797,17 @@ class ZenFolio:
         )
 
     def _build_blog_post_pages(self, blog_posts: List[Dict[str, Any]], base_url: str, seo_generator: Optional['SEOGenerator'] = None):
-        blog_output_dir = self.output_dir / 'blog'
-        blog_output_dir.mkdir(exist_ok=True)
-        processed_posts = self._process_items(blog_posts, 'blog_post_item', seo_generator)
+        make_dir(os.path.join(os.fspath(self.output_dir), 'blog'))
+        processed_posts = self._process_items(blog_posts, 'blog_post_item', seo_generator, base_url)
+        
+        # Calculate relative base URL for nested blog pages
+        nested_base_url = self.theme._build_relative_url(base_url, depth=1)
         
         for post in processed_posts:
             # Re-render content from raw source using appropriate processor
             content_type = post.get('content_type', 'blog_post')
             post['content'] = self._process_content_field(post['content_raw'], content_type, 'content')
             
-            # Calculate relative base URL for nested blog page
-            nested_base_url = self.theme._build_relative_url(base_url, depth=1)
-            
             # Process {static} placeholders in content
             post['content'] = self._process_static_placeholders(post['content'], nested_base_url)
             
@@ -605,48 +820,234 @@ class ZenFolio:
             )
 
     def _build_pages(self, base_url: str = "", seo_generator: Optional['SEOGenerator'] = None):
-        """Build standalone pages from the loaded content."""
-        if not self.content.pages:
+        """Build standalone pages from the loaded content, skipping those unchanged since the last build."""
+        pages = self.content.page_table
+        pages_dir = os.path.join(os.fspath(self.output_dir), "pages")
+        if not len(pages):
+            if os.path.isdir(pages_dir):
+                shutil.rmtree(pages_dir)
             return
         
         # Create pages directory in output
-        (self.output_dir / "pages").mkdir(exist_ok=True)
+        make_dir(pages_dir)
         
-        for page_data in self.content.pages:
-            slug = page_data['slug']
-            title = page_data['title']
-            
-            # Process content using appropriate processor
-            content_type = page_data.get('content_type', 'page')
-            content_html = self._process_content_field(page_data['content'], content_type, 'content')
-            
-            # Create full HTML page with proper nested base URL
-            nested_base_url = self.theme._build_relative_url(base_url, depth=1)
+        # Create full HTML pages with proper nested base URL
+        nested_base_url = self.theme._build_relative_url(base_url, depth=1)
+        
+        # A page is left as is when its fingerprint matches the manifest entry of the last
+        # build and its output file has not changed since (not in debug mode, where
+        # templates are being worked on)
+        filenames = [f"pages/{slug}.html" for slug in pages.slugs]
+        manifest = {}
+        stale = list(range(len(pages)))
+        if not self.debug:
+            previous = self._load_page_manifest()
+            site_digest = self._site_fingerprint(base_url)
+            stale = []
+            for index, (filename, page_data) in enumerate(zip(filenames, pages.rows)):
+                fingerprint = self._page_fingerprint(site_digest, page_data)
+                entry = previous.get(filename)
+                if entry and entry[0] == fingerprint:
+                    try:
+                        st = os.stat(os.path.join(os.fspath(self.output_dir), filename))
+                    except OSError:
+                        pass
+                    else:
+                        if entry[1:] == [st.st_size, st.st_mtime_ns]:
+                            manifest[filename] = entry
+                            continue
+                manifest[filename] = [fingerprint]
+                stale.append(index)
+        
+        # Reuse the rendered content of pages unchanged since the last build; only the
+        # others are converted. Every page's entry is named, so that the entries of
+        # skipped pages survive the pruning below
+        cache_paths = [
+            self._page_cache_path(content, content_type, nested_base_url)
+            for content, content_type in zip(pages.contents, pages.content_types)
+        ]
+        cached_content = {}
+        cached_names = set()
+        if not self.debug:
+            # One listing of the cache instead of a failed open per uncached page
+            try:
+                with os.scandir(self.page_cache_dir) as entries:
+                    cached_names = {entry.name for entry in entries}
+            except OSError:
+                pass
+            for index in stale:
+                cache_path = cache_paths[index]
+                if os.path.basename(cache_path) in cached_names:
+                    try:
+                        with open(cache_path, encoding='utf-8') as f:
+                            cached_content[cache_path] = f.read()
+                    except OSError:
+                        pass
+            # Created once here rather than checked before every cache write
+            if len(cached_content) < len(stale):
+                try:
+                    self.page_cache_dir.mkdir(parents=True, exist_ok=True)
+                except OSError:
+                    pass  # writes will fail and be skipped
+        self._preconvert_pages([
+            (pages.content_types[index], pages.contents[index])
+            for index in stale
+            if cache_paths[index] not in cached_content
+        ])
+        
+        stale = set(stale)
+        for index, (filename, title, content, content_type, page_data) in enumerate(zip(
+                filenames, pages.titles, pages.contents, pages.content_types, pages.rows)):
+            if index not in stale:
+                if seo_generator:
+                    self._track_seo_page(filename)
+                continue
             
-            # Process {static} placeholders in content
-            content_html = self._process_static_placeholders(content_html, nested_base_url)
+            cache_path = cache_paths[index]
+            page_content = cached_content.get(cache_path)
+            if page_content is None:
+                # Process content using appropriate processor
+                content_html = self._process_content_field(content, content_type, 'content')
+                
+                # Process {static} placeholders in content
+                content_html = self._process_static_placeholders(content_html, nested_base_url)
+                
+                # Render using page template
+                page_content = self.theme.render_content_wrapper('page', content_html)
+                if not self.debug:
+                    self._write_page_cache(cache_path, page_content)
             
-            # Render using page template
-            page_content = self.theme.render_component('page', item={'content': content_html})
             self._render_and_write_page(
-                f"pages/{slug}.html", page_content, page_title=title,
+                filename, page_content, page_title=title,
                 base_url=nested_base_url, current_page='pages',
                 seo_generator=seo_generator, page_type="page", item_data=page_data
             )
+            if filename in manifest:
+                try:
+                    st = os.stat(os.path.join(os.fspath(self.output_dir), filename))
+                except OSError:
+                    del manifest[filename]
+                else:
+                    manifest[filename] += [st.st_size, st.st_mtime_ns]
+        
+        # Remove the pages of sources that no longer exist
+        built_names = {f"{slug}.html" for slug in pages.slugs}
+        with os.scandir(pages_dir) as entries:
+            for entry in entries:
+                if entry.name not in built_names:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+        
+        if not self.debug:
+            self._write_page_manifest(manifest)
+            self._prune_page_cache(cached_names, {os.path.basename(path) for path in cache_paths})
+    
+    def _site_fingerprint(self, base_url: str) -> bytes:
+        """Digest of everything besides its own data that a standalone page depends on"""
+        # The footer shows the current year, so pages are rebuilt when it changes
+        digest = hashlib.sha256()
+        for part in (_PAGE_CACHE_VERSION, _package_versions(), MARKDOWN_BACKEND, self.theme.__class__.__name__,
+                     self.theme.template_digest(), str(datetime.now().year), base_url,
+                     repr(self.built_pages), repr(self.config.to_dict())):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.digest()
+    
+    def _page_fingerprint(self, site_digest: bytes, page_data: Dict[str, Any]) -> str:
+        """Hash of a standalone page's data (front matter and content) and the site it is built in"""
+        digest = hashlib.sha256(site_digest)
+        digest.update(repr(page_data).encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _load_page_manifest(self) -> Dict[str, list]:
+        """Page fingerprints recorded by the last build, empty if missing or unreadable"""
+        try:
+            with open(self.page_manifest_path, 'rb') as f:
+                manifest = _loads_json(f.read())
+        except (OSError, ValueError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+    
+    def _write_page_manifest(self, manifest: Dict[str, list]):
+        """Atomically replace the page manifest; failures are ignored (pages are rebuilt next time)"""
+        path = os.fspath(self.page_manifest_path)
+        tmp_path = path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_bytes(tmp_path, _dumps_json(manifest))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log.debug("⚠️  Warning: Failed to write page manifest %s: %s", path, e)
+    
+    def _page_cache_path(self, content: str, content_type: str, base_url: str) -> str:
+        """Cache file for a page's rendered content, named after a hash of everything it depends on"""
+        digest = hashlib.sha256()
+        for part in (_PAGE_CACHE_VERSION, _package_versions(), MARKDOWN_BACKEND, self.theme.__class__.__name__,
+                     self.theme.template_digest(), repr(self.config.site.markdown_extensions),
+                     base_url, content_type, content):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return os.path.join(os.fspath(self.page_cache_dir), digest.hexdigest() + ".html")
+    
+    def _write_page_cache(self, cache_path: str, page_content: str):
+        """Store a page's rendered content in the (existing) cache directory; failures are ignored"""
+        try:
+            write_bytes(cache_path, page_content.encode('utf-8'))
+        except OSError as e:
+            log.debug("⚠️  Warning: Failed to write page cache %s: %s", cache_path, e)
+    
+    def _prune_page_cache(self, cached_names: set, used_names: set):
+        """Remove cache entries listed before this build that none of its pages used"""
+        for name in cached_names - used_names:
+            try:
+                os.unlink(os.path.join(os.fspath(self.page_cache_dir), name))
+            except OSError:
+                pass
+    
+    def clean_cache(self):
+        """Remove all cached page content and the page manifest"""
+        if self.page_cache_dir.exists():
+            shutil.rmtree(self.page_cache_dir)
+        if self.page_manifest_path.exists():
+            self.page_manifest_path.unlink()
+    
+    def _preconvert_pages(self, pages: List[tuple]):
+        """
+        Convert the markdown of many (content_type, content) pages on worker processes,
+        filling the content cache.
+        
+        Only the markdown conversion is a pure function of the page source, so it is the
+        part sent to workers; templating and writing stay in this process.
+        """
+        pending = {}
+        for key in pages:
+            if key[0] in _MARKDOWN_CONTENT_TYPES and key not in self._content_cache:
+                pending[key] = key[1]
+        if len(pending) < _PARALLEL_PAGES_MIN:
+            return
+        
+        convert = partial(_convert_markdown, extensions=tuple(self.config.site.markdown_extensions))
+        workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers, mp_context=self.mp_context) as executor:
+            # A couple of pages queued per worker keeps them busy without holding every
+            # page source and result in the executor's queues at once
+            results = map_bounded(executor, convert, pending.values(), max_in_flight=workers * 2)
+            for key, html in zip(pending, results):
+                # Failed conversions are left to the regular path, which reports them
+                if html is not None:
+                    self._content_cache[key] = html
     
     def _generate_sitemap(self, seo_generator: 'SEOGenerator'):
         """Generate sitemap.xml file"""
         if not self.seo_pages:
-            if self.debug:
-                print("⚠️  Warning: No pages tracked for sitemap generation")
+            log.debug("⚠️  Warning: No pages tracked for sitemap generation")
             return
             
-        sitemap_xml = seo_generator.generate_sitemap_xml(self.seo_pages)
-        sitemap_path = self.output_dir / "sitemap.xml"
-        sitemap_path.write_text(sitemap_xml, encoding='utf-8')
+        seo_generator.write_sitemap_xml(self.seo_pages, self.output_dir / "sitemap.xml")
         
-        if self.debug:
-            print(f"✅ Generated sitemap with {len(self.seo_pages)} pages")
+        log.debug("✅ Generated sitemap with %d pages", len(self.seo_pages))
 
 
 def get_output_dir(content_dir: Path) -> Path:
@@ -663,27 +1064,31 @@ class ZenFolioBuildError(Exception):
     pass
 
 
-def build_site(content_dir: Path, theme_override: str = None, debug: bool = False, base_url: str = None, dev: bool = False) -> bool:
+def build_site(content_dir: Path, theme_override: str = None, debug: bool = False, base_url: str = None, dev: bool = False,
+               clean_cache: bool = False) -> bool:
     """Build the site with centralized error handling
     
+    Debug messages go to the 'zenfolio' logger, which has no output handler of its own:
+    the CLI prints them with --debug, other callers configure logging to see them
+    (e.g. logging.basicConfig(level=logging.DEBUG)).
+    
     Returns:
         bool: True if build succeeded, False otherwise
     """
     try:
         ssg = ZenFolio(content_dir=content_dir, theme_override=theme_override, debug=debug)
+        if clean_cache:
+            ssg.clean_cache()
         
         if dev:
             final_base_url = ""
-            if debug:
-                print("🔧 Development mode: using relative URLs")
+            log.debug("🔧 Development mode: using relative URLs")
         elif base_url is not None:
             final_base_url = base_url
-            if debug:
-                print(f"🔧 Using explicit base URL: {final_base_url}")
+            log.debug("🔧 Using explicit base URL: %s", final_base_url)
         else:
             final_base_url = ssg.config.site.base_url
-            if debug:
-                print(f"🔧 Using site.base_url as base URL: {final_base_url}")
+            log.debug("🔧 Using site.base_url as base URL: %s", final_base_url)
         
         success = ssg.build(base_url=final_base_url)
         
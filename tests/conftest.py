@@ -1,20 +1,89 @@
 """Pytest fixtures - everything you need in one place"""
+import multiprocessing
+import os
 import pytest
 import shutil
 from pathlib import Path
+from bs4 import BeautifulSoup
 from zenfolio.zenfolio import ZenFolio
 
 # Define the root of the project and the actual website content
 WEBSITE_ROOT = Path(__file__).parent.parent.parent / "website"
 ZENFOLIO_ROOT = Path(__file__).parent.parent
 
+def _link_or_copy(src, dst):
+    """Hardlink a source file, copying only when linking is not possible (e.g. across devices)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
 @pytest.fixture(scope="session")
 def site_root(tmp_path_factory):
-    """A pytest fixture to create a temporary, clean copy of the actual website."""
+    """A pytest fixture to create a temporary, clean copy of the actual website.
+
+    The copy is made of hardlinks (stale build artifacts are left out), so it is shared
+    by the whole session and only fit for reading and for debug builds, which write their
+    output outside the content directory and nothing inside it. Non-debug builds write
+    .zenfolio-cache/ into the content directory: use copy_site or fresh_site for those.
+    Nothing may modify the files in place, as that would write through to the website.
+    """
     tmp_dir = tmp_path_factory.mktemp("test-site")
-    shutil.copytree(WEBSITE_ROOT, tmp_dir, dirs_exist_ok=True)
+    shutil.copytree(WEBSITE_ROOT, tmp_dir, dirs_exist_ok=True, copy_function=_link_or_copy,
+                    ignore=shutil.ignore_patterns("_site", ".zenfolio-cache"))
     return tmp_dir
 
+@pytest.fixture
+def copy_site(tmp_path):
+    """Make full copies of the website, for builds that write next to the sources.
+
+    Each copy gets its own folder under tmp_path, so that the output directory (_site by
+    default, next to the content) is not shared between copies.
+    """
+    def _copy_site(name="website"):
+        site_dir = tmp_path / name / "website"
+        shutil.copytree(WEBSITE_ROOT, site_dir, ignore=shutil.ignore_patterns("_site", ".zenfolio-cache"))
+        return site_dir
+    return _copy_site
+
+@pytest.fixture
+def fresh_site(copy_site):
+    """A full copy of the website for one test."""
+    return copy_site()
+
+@pytest.fixture
+def build():
+    """Build a site and return its ZenFolio instance (non-debug by default, like a real build)."""
+    def _build(content_dir, theme="tailwind", debug=False, base_url="", **attrs):
+        ssg = ZenFolio(content_dir=content_dir, theme_override=theme, debug=debug)
+        for name, value in attrs.items():
+            setattr(ssg, name, value)
+        assert ssg.build(base_url=base_url)
+        return ssg
+    return _build
+
+@pytest.fixture(scope="session")
+def read_tree():
+    """Read a directory tree as {relative path: bytes}, to compare build outputs or copies."""
+    def _read_tree(root):
+        return {
+            os.path.relpath(os.path.join(path, name), root): Path(path, name).read_bytes()
+            for path, _, names in os.walk(root) for name in names
+        }
+    return _read_tree
+
+@pytest.fixture(scope="session")
+def mp_context():
+    """A forkserver context whose server has the builder's dependencies imported already,
+    so that worker processes started by builds skip those imports (None where forkserver
+    is not available)."""
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return None
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(["jinja2", "markdown", "zenfolio.zenfolio"])
+    return ctx
+
 @pytest.fixture(scope="session")
 def built_site(site_root):
     """A pytest fixture that builds the site and returns the output path."""
@@ -34,3 +103,8 @@ def built_site(site_root):
         pytest.fail(f"The build completed but the output directory '{output_dir}' was not created.")
         
     return output_dir
+
+@pytest.fixture(scope="session")
+def homepage_soup(built_site):
+    """The built homepage, parsed once per session with lxml (fed raw bytes, no decode step)."""
+    return BeautifulSoup((built_site / "index.html").read_bytes(), "lxml")
@@ -0,0 +1,112 @@
+"""Incremental builds: standalone pages left untouched when nothing they depend on changed"""
+import os
+import subprocess
+import sys
+from datetime import datetime
+
+import pytest
+
+import zenfolio.zenfolio as zenfolio_module
+
+
+def _page_mtimes(ssg):
+    return {path.name: path.stat().st_mtime_ns for path in (ssg.output_dir / "pages").iterdir()}
+
+
+def _first_page(site_dir):
+    return sorted((site_dir / "pages").glob("*.md"))[0]
+
+
+def test_unchanged_pages_are_skipped(fresh_site, build):
+    first = _page_mtimes(build(fresh_site))
+    ssg = build(fresh_site)
+    
+    assert first and _page_mtimes(ssg) == first
+    # Skipped pages are still listed in the sitemap
+    sitemap = (ssg.output_dir / "sitemap.xml").read_text(encoding="utf-8")
+    for name in first:
+        assert f"pages/{name}" in sitemap
+
+
+def test_edited_page_is_rebuilt(fresh_site, build):
+    first = _page_mtimes(build(fresh_site))
+    page = _first_page(fresh_site)
+    page.write_text(page.read_text(encoding="utf-8") + "\n\nA freshly added sentence.\n", encoding="utf-8")
+    
+    ssg = build(fresh_site)
+    second = _page_mtimes(ssg)
+    
+    changed = {name for name in first if second[name] != first[name]}
+    assert changed == {f"{page.stem}.html"}
+    html = (ssg.output_dir / "pages" / f"{page.stem}.html").read_text(encoding="utf-8")
+    assert "A freshly added sentence." in html
+
+
+def test_modified_output_is_rewritten(fresh_site, build):
+    ssg = build(fresh_site)
+    output = ssg.output_dir / "pages" / f"{_first_page(fresh_site).stem}.html"
+    output.write_text("tampered", encoding="utf-8")
+    
+    build(fresh_site)
+    assert output.read_text(encoding="utf-8") != "tampered"
+
+
+def test_deleted_page_is_pruned(fresh_site, build):
+    build(fresh_site)
+    page = _first_page(fresh_site)
+    page.unlink()
+    
+    ssg = build(fresh_site)
+    assert not (ssg.output_dir / "pages" / f"{page.stem}.html").exists()
+    assert f"pages/{page.stem}.html" not in (ssg.output_dir / "sitemap.xml").read_text(encoding="utf-8")
+
+
+def test_site_fingerprint_covers_templates_and_year(fresh_site, build, monkeypatch):
+    ssg = build(fresh_site)
+    fingerprint = ssg._site_fingerprint("")
+    
+    monkeypatch.setattr(ssg.theme, "_template_digest", "edited templates")
+    assert ssg._site_fingerprint("") != fingerprint
+    monkeypatch.undo()
+    
+    class NextYear(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(datetime.now().year + 1, 1, 1)
+    
+    monkeypatch.setattr(zenfolio_module, "datetime", NextYear)
+    assert ssg._site_fingerprint("") != fingerprint
+
+
+def test_markdown_backend_switch_rebuilds_pages(fresh_site):
+    pytest.importorskip("markdown_it_pyrs")
+    
+    def build_with(fast_md):
+        # The backend is chosen from the environment at import time, so each build runs in its own interpreter
+        env = dict(os.environ, ZF_FAST_MD=fast_md)
+        script = "import sys; from pathlib import Path; from zenfolio.zenfolio import ZenFolio; assert ZenFolio(Path(sys.argv[1])).build()"
+        subprocess.run([sys.executable, "-c", script, str(fresh_site)], env=env, check=True, capture_output=True)
+        return {path.name: path.read_text(encoding="utf-8") for path in (fresh_site.parent / "_site" / "pages").iterdir()}
+    
+    default = build_with("")
+    fast = build_with("1")
+    assert fast != default
+    assert build_with("") == default
+
+
+def test_debug_builds_ignore_the_manifest(fresh_site, build):
+    ssg = build(fresh_site, debug=True)
+    assert not ssg.page_manifest_path.exists()
+
+
+def test_content_cache_is_reset_between_builds(fresh_site):
+    ssg = zenfolio_module.ZenFolio(content_dir=fresh_site, theme_override="tailwind")
+    assert ssg.build(base_url="")
+    page = _first_page(fresh_site)
+    original = page.read_text(encoding="utf-8")
+    
+    for index in range(3):
+        page.write_text(original + f"\n\nEdit number {index}.\n", encoding="utf-8")
+        assert ssg.build(base_url="")
+    
+    assert not any("Edit number 0" in source for _, source in ssg._content_cache)
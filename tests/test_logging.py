@@ -0,0 +1,34 @@
+"""The package logs through the 'zenfolio' logger and leaves handlers to applications"""
+import logging
+
+from zenfolio.zenfolio import ZenFolio
+
+
+def test_library_adds_no_output_handler(site_root):
+    logger = logging.getLogger("zenfolio")
+    before = list(logger.handlers)
+    ZenFolio(content_dir=site_root, theme_override="tailwind", debug=True)
+    
+    assert logger.handlers == before
+    assert all(isinstance(handler, logging.NullHandler) for handler in logger.handlers)
+
+
+def test_debug_messages_reach_the_host_application(site_root, caplog):
+    ssg = ZenFolio(content_dir=site_root, theme_override="tailwind", debug=True)
+    with caplog.at_level(logging.DEBUG, logger="zenfolio"):
+        ssg._generate_sitemap(seo_generator=None)
+    assert "No pages tracked for sitemap generation" in caplog.text
+
+
+def test_cli_logging_is_configured_once(monkeypatch):
+    from zenfolio.cli import _configure_logging
+    
+    logger = logging.getLogger("zenfolio")
+    monkeypatch.setattr(logger, "handlers", list(logger.handlers))
+    monkeypatch.setattr(logger, "level", logger.level)
+    before = len(logger.handlers)
+    _configure_logging(debug=True)
+    _configure_logging(debug=False)
+    
+    assert len(logger.handlers) == before + 1
+    assert logger.level == logging.WARNING
@@ -0,0 +1,78 @@
+"""Markdown rendering of content fields"""
+import re
+import textwrap
+
+import markdown
+import pytest
+
+from zenfolio.parsers import markdown_parser
+from zenfolio.parsers.markdown_parser import _mistune_renderer, create_markdown_renderer
+from zenfolio.zenfolio import ZenFolio
+
+
+def test_blog_posts_use_the_shared_renderer(site_root):
+    """Markdown posts (content type 'markdown') skip the processor dispatch"""
+    ssg = ZenFolio(content_dir=site_root, theme_override="tailwind", debug=True)
+    ssg.content.load()
+    rendered = []
+    shared = ssg._md
+    def recording_md(text):
+        rendered.append(text)
+        return shared(text)
+    ssg._md = recording_md
+    def no_dispatch(content_type):
+        raise AssertionError(f"processor dispatch reached for {content_type}")
+    ssg._get_content_processors = no_dispatch
+    
+    assert ssg.content.blog_posts
+    for post in ssg.content.blog_posts:
+        assert post['content_type'] == 'markdown'
+        html = ssg._process_content_field(post['content'], post['content_type'], 'content')
+        assert rendered[-1] == textwrap.dedent(post['content']).strip()
+        assert html == shared(rendered[-1])
+
+
+# Markdown features mistune covers, with the Python-Markdown extensions they need
+MISTUNE_FEATURES = {
+    "inline": ("Some *emphasis*, **strong** and `code` with a [link](https://example.org).", ()),
+    "headings": ("# Title\n\n## Subtitle\n\nText.", ()),
+    "lists": ("- one\n- two\n\nText.\n\n1. first\n2. second", ()),
+    "raw_html": ("<div>raw</div>\n\nAfter & before", ()),
+    "fenced_code": ("```python\nx = 1 < 2\n```", ("fenced_code",)),
+    "tables": ("| A | B |\n|---|---|\n| 1 | 2 |", ("tables",)),
+    "def_list": ("Term\n: Definition", ("def_list",)),
+    "abbr": ("*[HTML]: Hyper Text Markup Language\n\nHTML is everywhere.", ("abbr",)),
+}
+
+
+def _normalized(html):
+    """Markup with the whitespace between tags dropped (mistune indents table cells)"""
+    return re.sub(r">\s+<", "><", html).strip()
+
+
+@pytest.mark.parametrize("feature", sorted(MISTUNE_FEATURES))
+def test_mistune_matches_python_markdown(feature):
+    pytest.importorskip("mistune")
+    text, extensions = MISTUNE_FEATURES[feature]
+    python_markdown = markdown.Markdown(extensions=list(extensions)).convert(text)
+    assert _normalized(_mistune_renderer(extensions)(text)) == _normalized(python_markdown)
+
+
+def test_mistune_differs_on_footnotes():
+    """The documented difference that keeps mistune opt-in"""
+    pytest.importorskip("mistune")
+    text = "Text[^1].\n\n[^1]: Note."
+    python_markdown = markdown.Markdown(extensions=["footnotes"]).convert(text)
+    assert _normalized(_mistune_renderer(("footnotes",))(text)) != _normalized(python_markdown)
+
+
+def test_python_markdown_is_the_default(monkeypatch):
+    """Extension sets mistune covers still render with Python-Markdown unless ZF_MISTUNE is set"""
+    monkeypatch.setattr(markdown_parser, "_MISTUNE", False)
+    monkeypatch.setattr(markdown_parser, "_FAST_MD", False)
+    create_markdown_renderer.cache_clear()
+    text = "Text[^1].\n\n[^1]: Note."
+    try:
+        assert create_markdown_renderer(("footnotes",))(text) == markdown.Markdown(extensions=["footnotes"]).convert(text)
+    finally:
+        create_markdown_renderer.cache_clear()
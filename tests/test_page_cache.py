@@ -0,0 +1,83 @@
+"""Rendered page content cache (.zenfolio-cache/pages) and --clean-cache"""
+import pytest
+
+import zenfolio.zenfolio as zenfolio_module
+from zenfolio.zenfolio import ZenFolio, build_site
+
+
+def _cache_names(ssg):
+    return {path.name for path in ssg.page_cache_dir.iterdir()}
+
+
+def test_cached_content_is_reused(fresh_site, build):
+    ssg = build(fresh_site)
+    assert len(_cache_names(ssg)) == len(ssg.content.page_table)
+    pages_dir = ssg.output_dir / "pages"
+    first = {path.name: path.read_bytes() for path in pages_dir.iterdir()}
+    
+    # Without the manifest every page is written again, from the cache
+    ssg.page_manifest_path.unlink()
+    rebuilt = ZenFolio(content_dir=fresh_site, theme_override="tailwind")
+    def no_rendering(*args, **kwargs):
+        raise AssertionError("page content rendered despite a cache entry")
+    rebuilt.theme.render_content_wrapper = no_rendering
+    assert rebuilt.build(base_url="")
+    
+    assert {path.name: path.read_bytes() for path in pages_dir.iterdir()} == first
+
+
+def test_unused_entries_are_pruned(fresh_site, build):
+    first = _cache_names(build(fresh_site))
+    page = sorted((fresh_site / "pages").glob("*.md"))[0]
+    page.write_text(page.read_text(encoding="utf-8") + "\n\nEdited.\n", encoding="utf-8")
+    
+    ssg = build(fresh_site)
+    second = _cache_names(ssg)
+    assert len(second) == len(ssg.content.page_table)
+    assert len(first - second) == 1
+
+
+def test_cache_key_covers_templates(fresh_site, monkeypatch):
+    ssg = ZenFolio(content_dir=fresh_site, theme_override="tailwind")
+    path = ssg._page_cache_path("Some *content*", "page", "../")
+    monkeypatch.setattr(ssg.theme, "_template_digest", "edited templates")
+    assert ssg._page_cache_path("Some *content*", "page", "../") != path
+
+
+def test_cache_key_covers_renderer_and_library_versions(fresh_site, monkeypatch):
+    ssg = ZenFolio(content_dir=fresh_site, theme_override="tailwind")
+    path = ssg._page_cache_path("Some *content*", "page", "../")
+    assert "Pygments" in zenfolio_module._package_versions()
+    
+    monkeypatch.setattr(zenfolio_module, "MARKDOWN_BACKEND", "another-backend")
+    assert ssg._page_cache_path("Some *content*", "page", "../") != path
+    monkeypatch.undo()
+    
+    monkeypatch.setattr(zenfolio_module, "_package_versions", lambda: "Pygments==99.0")
+    assert ssg._page_cache_path("Some *content*", "page", "../") != path
+
+
+def test_debug_builds_do_not_cache(fresh_site, build):
+    ssg = build(fresh_site, debug=True)
+    assert not ssg.page_cache_dir.exists()
+
+
+@pytest.mark.parametrize("through_build_site", [False, True])
+def test_clean_cache(fresh_site, build, through_build_site):
+    ssg = build(fresh_site)
+    # Entries whose content no longer matches what their key stands for
+    for path in ssg.page_cache_dir.iterdir():
+        path.write_text("STALE-CACHE", encoding="utf-8")
+    
+    if through_build_site:
+        # The --clean-cache flag: the cache is emptied before the build (the manifest is
+        # dropped too, so that pages are not simply skipped either way)
+        ssg.page_manifest_path.unlink()
+        assert build_site(fresh_site, "tailwind", base_url="", clean_cache=True)
+        for path in (ssg.output_dir / "pages").iterdir():
+            assert "STALE-CACHE" not in path.read_text(encoding="utf-8")
+        assert len(_cache_names(ssg)) == len(ssg.content.page_table)
+    else:
+        ssg.clean_cache()
+        assert not ssg.page_cache_dir.exists()
+        assert not ssg.page_manifest_path.exists()
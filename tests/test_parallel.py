@@ -0,0 +1,58 @@
+"""Builds large enough to convert pages on worker processes give the same site as serial ones"""
+import zenfolio.zenfolio as zenfolio_module
+
+# Markdown features used by pages: headings, emphasis, lists, code, tables, links,
+# {static} placeholders and images relative to the content's images/ folder
+PAGE_TEMPLATE = """---
+title: Generated page {index}
+slug: generated-{index}
+---
+# Section {index}
+
+Some *emphasis*, **strong text** and `inline code`, with a [link](https://example.org/{index}).
+
+- first item
+- second item with {{static}}/files/doc-{index}.pdf
+
+```python
+def page_{index}():
+    return {index}
+```
+
+| Column | Value |
+|--------|-------|
+| index  | {index} |
+
+![figure](images/figure-{index}.png)
+"""
+
+
+def _add_pages(site_dir, count):
+    for index in range(count):
+        (site_dir / "pages" / f"generated-{index:03d}.md").write_text(PAGE_TEMPLATE.format(index=index), encoding="utf-8")
+
+
+def test_process_pool_build_matches_serial_build(copy_site, build, mp_context, monkeypatch, read_tree):
+    count = zenfolio_module._PARALLEL_PAGES_MIN + 8
+    pooled_site, serial_site = copy_site("pooled"), copy_site("serial")
+    _add_pages(pooled_site, count)
+    _add_pages(serial_site, count)
+    
+    pools = []
+    class RecordingPool(zenfolio_module.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(kwargs)
+            super().__init__(*args, **kwargs)
+    monkeypatch.setattr(zenfolio_module, "ProcessPoolExecutor", RecordingPool)
+    
+    # Workers come from the forkserver with the preloaded modules, where available
+    pooled = build(pooled_site, mp_context=mp_context)
+    assert len(pools) == 1 and pools[0]['mp_context'] is mp_context
+    
+    monkeypatch.setattr(zenfolio_module, "_PARALLEL_PAGES_MIN", 10 ** 6)
+    serial = build(serial_site)
+    assert len(pools) == 1
+    
+    pooled_tree, serial_tree = read_tree(pooled.output_dir), read_tree(serial.output_dir)
+    assert len([name for name in pooled_tree if name.startswith("pages")]) == count + 2
+    assert pooled_tree == serial_tree
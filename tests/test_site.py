@@ -1,6 +1,5 @@
 from pathlib import Path
 import pytest
-from bs4 import BeautifulSoup
 
 # --- Test Data ---
 
@@ -22,12 +21,11 @@ def test_build_succeeds(built_site):
     index_path = built_site / "index.html"
     assert index_path.exists(), "The main index.html file should be created."
 
-def test_homepage_structure_and_layout(built_site):
+def test_homepage_structure_and_layout(homepage_soup):
     """
     Verify that the main page has the correct structure and consistent layout.
     """
-    index_path = built_site / "index.html"
-    soup = BeautifulSoup(index_path.read_text(encoding='utf-8'), "html.parser")
+    soup = homepage_soup
     
     # Find all section headers
     section_titles = {h2.text.strip() for h2 in soup.find_all('h2', class_='heading')}
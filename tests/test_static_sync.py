@@ -0,0 +1,95 @@
+"""Incremental mirroring of the static/ folder into the output"""
+import os
+
+import pytest
+
+import zenfolio.utils
+import zenfolio.zenfolio
+from zenfolio.zenfolio import ZenFolio
+
+
+@pytest.fixture
+def ssg(site_root):
+    return ZenFolio(content_dir=site_root, theme_override="tailwind", debug=True)
+
+
+@pytest.fixture
+def copies(monkeypatch):
+    """Paths copied by the static sync and the theme assets, from the moment it is requested"""
+    copied = []
+    def recording_copy(src, dst, _copy=zenfolio.utils.copy_file):
+        copied.append(os.fspath(dst))
+        _copy(src, dst)
+    monkeypatch.setattr(zenfolio.zenfolio, "copy_file", recording_copy)
+    monkeypatch.setattr(zenfolio.utils, "copy_file", recording_copy)
+    return copied
+
+
+def _make_source(root):
+    (root / "css").mkdir(parents=True)
+    (root / "profile.jpg").write_bytes(b"jpeg")
+    (root / "css" / "extra.css").write_text("body {}")
+    return root
+
+
+def test_new_files_are_copied_with_their_mtime(ssg, tmp_path, read_tree):
+    src = _make_source(tmp_path / "src")
+    dst = tmp_path / "dst"
+    ssg._copy_static_incremental(str(src), str(dst))
+    
+    assert read_tree(dst) == read_tree(src)
+    assert os.stat(dst / "css" / "extra.css").st_mtime_ns == os.stat(src / "css" / "extra.css").st_mtime_ns
+
+
+def test_unchanged_files_are_skipped(ssg, tmp_path, copies, read_tree):
+    src = _make_source(tmp_path / "src")
+    dst = tmp_path / "dst"
+    ssg._copy_static_incremental(str(src), str(dst))
+    assert len(copies) == 2
+    
+    copies.clear()
+    (src / "profile.jpg").write_bytes(b"a new jpeg")
+    ssg._copy_static_incremental(str(src), str(dst))
+    assert copies == [str(dst / "profile.jpg")]
+    assert read_tree(dst) == read_tree(src)
+
+
+def test_deleted_and_replaced_entries_are_removed(ssg, tmp_path, read_tree):
+    src = _make_source(tmp_path / "src")
+    dst = tmp_path / "dst"
+    ssg._copy_static_incremental(str(src), str(dst))
+    
+    (src / "css" / "extra.css").unlink()
+    (src / "css").rmdir()
+    (src / "css").write_text("now a file")
+    (src / "profile.jpg").unlink()
+    (src / "profile.jpg").mkdir()
+    (src / "profile.jpg" / "inner.txt").write_text("inner")
+    (dst / "leftover.txt").write_text("gone from the source")
+    ssg._copy_static_incremental(str(src), str(dst))
+    
+    assert read_tree(dst) == read_tree(src)
+
+
+def test_kept_names_survive_pruning(ssg, tmp_path):
+    src = _make_source(tmp_path / "src")
+    dst = tmp_path / "dst"
+    dst.mkdir()
+    (dst / "theme.css").write_text("theme")
+    ssg._copy_static_incremental(str(src), str(dst), keep=("theme.css",))
+    
+    assert (dst / "theme.css").read_text() == "theme"
+
+
+@pytest.mark.parametrize("theme", ["tailwind", "minimal"])
+def test_theme_assets_are_kept_and_not_recopied(fresh_site, build, copies, theme):
+    ssg = build(fresh_site, theme=theme)
+    static_out = ssg.output_dir / "static"
+    for name in ssg.theme.STATIC_ASSETS:
+        assert name in {path.name for path in static_out.iterdir()}
+    
+    copies.clear()
+    build(fresh_site, theme=theme)
+    assert copies == []
+    for name in ssg.theme.STATIC_ASSETS:
+        assert (static_out / name).exists()
@@ -0,0 +1,16 @@
+"""Theme component rendering"""
+from jinja2 import TemplateSyntaxError
+
+from zenfolio.themes import TailwindTheme
+
+
+def test_broken_component_is_only_reported_in_debug(capsys):
+    for debug in (False, True):
+        theme = TailwindTheme(debug=debug)
+        capsys.readouterr()
+        def broken(name):
+            raise TemplateSyntaxError("unexpected end of template", 1)
+        theme.env.get_template = broken
+        
+        assert theme.render_component("broken_component") == ""
+        assert ("Failed to load template" in capsys.readouterr().out) == debug
@@ -0,0 +1,26 @@
+"""URL building helpers"""
+from urllib.parse import urljoin
+
+import pytest
+
+from zenfolio.utils import build_url
+
+BASES = [
+    "https://example.org", "https://example.org/", "https://example.org/site/",
+    "https://example.org/a/../b", "https://example.org/./a/", "https://example.org/a/.",
+    "https://example.org/a/..", "https://example.org//a/", "https://example.org/a//b/",
+    "https://example.org/.well-known/", "http://example.org:8000/site?x=1", "https://example.org/#top",
+]
+PATHS = ["index.html", "static/style.css", "pages/about.html", "a/./b.html", "../up.html", "/rooted.html"]
+
+
+@pytest.mark.parametrize("base_url", BASES)
+@pytest.mark.parametrize("path", PATHS)
+def test_absolute_urls_match_urljoin(base_url, path):
+    assert build_url(base_url, path) == urljoin(base_url.rstrip('/') + '/', path.lstrip('/'))
+
+
+def test_relative_urls():
+    assert build_url("", "/static/style.css") == "static/style.css"
+    assert build_url("./", "index.html") == "index.html"
+    assert build_url("../", "static/style.css") == "../static/style.css"
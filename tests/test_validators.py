@@ -0,0 +1,28 @@
+"""Validation of content directories and generated sites"""
+import os
+
+from zenfolio.validators import _iter_html, validate_site
+
+
+def test_validate_site_reports_a_file_instead_of_a_directory(tmp_path, capsys):
+    not_a_dir = tmp_path / "config.py"
+    not_a_dir.write_text("")
+    
+    assert validate_site(not_a_dir) is False
+    assert "cannot be read" in capsys.readouterr().out
+
+
+def test_validate_site_reports_a_missing_directory(tmp_path, capsys):
+    assert validate_site(tmp_path / "missing") is False
+    assert "does not exist" in capsys.readouterr().out
+
+
+def test_iter_html_does_not_follow_directory_symlinks(tmp_path):
+    (tmp_path / "pages").mkdir()
+    (tmp_path / "index.html").write_text("")
+    (tmp_path / "pages" / "about.html").write_text("")
+    os.symlink(tmp_path, tmp_path / "pages" / "loop")
+    
+    assert sorted(os.path.relpath(path, tmp_path) for path in _iter_html(str(tmp_path))) == [
+        "index.html", os.path.join("pages", "about.html")
+    ]